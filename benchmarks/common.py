@@ -0,0 +1,76 @@
+"""
+Funções auxiliares compartilhadas pelos scripts de medição de desempenho
+"""
+
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from AF import AF
+
+def randomDFA(n, k, seed=0, density=1.0):
+  """
+  Gera um autômato finito determinístico aleatório, com estados de 1 a n e terminais a, b, c, ...
+
+  Parameters
+  ----------
+  n: int
+    número de estados
+  k: int
+    número de terminais
+  seed [default=0]: int
+    semente do gerador aleatório
+  density [default=1.0]: float
+    probabilidade de cada par (estado, terminal) ter transição
+  """
+
+  rng = random.Random(seed)
+  terminals = [chr(ord('a') + c) for c in range(k)]
+
+  transitions = dict()
+  for fonte in range(1, n + 1):
+    for terminal in terminals:
+      if rng.random() < density:
+        transitions.setdefault((fonte, rng.randint(1, n)), []).append(terminal)
+
+  return AF(list(range(1, n + 1)), transitions, 1, rng.sample(range(1, n + 1), n // 2 or 1))
+
+def randomWords(terminals, count, length, seed=0):
+  """
+  Gera cadeias aleatórias sobre um alfabeto, com tamanhos de 0 a length
+
+  Parameters
+  ----------
+  terminals: list
+    alfabeto das cadeias
+  count: int
+    número de cadeias
+  length: int
+    tamanho máximo das cadeias
+  seed [default=0]: int
+    semente do gerador aleatório
+  """
+
+  rng = random.Random(seed)
+  terminals = [t for t in terminals if t != '&'] or ['a']
+
+  return [''.join(rng.choice(terminals) for _ in range(rng.randint(0, length))) for _ in range(count)]
+
+def timed(function):
+  """
+  Executa uma função e retorna uma tupla com seu resultado e o tempo gasto, em segundos
+
+  Parameters
+  ----------
+  function: function
+    função sem parâmetros
+  """
+
+  start = time.perf_counter()
+  result = function()
+
+  return (result, time.perf_counter() - start)
@@ -0,0 +1,73 @@
+"""
+Compara o reconhecimento de cadeias pela tabela compilada do AFD com o caminho anterior à compilação
+
+O caminho anterior mantém uma lista de estados atuais e procura, a cada símbolo, as transições de cada estado no
+dicionário de transições. Os autômatos de tests/AFD/*.txt e AFDs aleatórios maiores são medidos.
+
+Uso: python benchmarks/compile.py [cadeias]
+"""
+
+import os
+import sys
+import glob
+
+from common import ROOT, randomDFA, randomWords, timed
+
+from AF import AF
+from AFD import AFD
+
+def reference(af, input):
+  """
+  Verifica se o autômato reconhece uma cadeia, pelo caminho anterior à compilação
+
+  Parameters
+  ----------
+  af: AF object
+    instância de um autômato finito
+  input: str
+    cadeia de caracteres de entrada
+  """
+
+  cs = [af.initial]
+  for t in input:
+    cs = [ns for vertice in cs for (fonte, ns), x in af.transitions.items() if fonte == vertice and t in x]
+
+  return any([x in af.final for x in cs])
+
+def report(name, af, words, sample):
+  """
+  Mede e imprime a vazão dos dois caminhos em um autômato
+
+  Parameters
+  ----------
+  name: str
+    nome do autômato
+  af: AF object
+    instância de um autômato finito determinístico
+  words: list
+    cadeias de entrada
+  sample: int
+    número de cadeias usadas no caminho anterior, que é muito mais lento
+  """
+
+  afd = AFD(af)
+  (_, compile_time) = timed(afd.compile)
+  (expected, old_time) = timed(lambda: [reference(af, w) for w in words[:sample]])
+  (result, new_time) = timed(lambda: [afd.readInput(w) for w in words])
+  (batch, batch_time) = timed(lambda: afd.readMany(words))
+
+  assert result[:sample] == expected and batch.tolist() == result
+
+  print(f'{name:>24} | {len(af.vertices):>7} | {sample / old_time:>12,.0f} | {len(words) / new_time:>12,.0f} | {len(words) / batch_time:>12,.0f} | {compile_time:8.3f}s')
+
+if __name__ == '__main__':
+  count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+  print(f'{"autômato":>24} | {"estados":>7} | {"anterior/s":>12} | {"compilado/s":>12} | {"readMany/s":>12} | {"compile":>9}')
+  for arquivo in sorted(glob.glob(os.path.join(ROOT, 'tests', 'AFD', '*.txt'))):
+    af = AF.fromFile(arquivo)
+    report(os.path.basename(arquivo), af, randomWords(af.terminals, count, 20), count)
+
+  for n in [1000, 100000]:
+    af = randomDFA(n, 4)
+    report(f'aleatório ({n})', af, randomWords(af.terminals, count, 20), 20 if n > 1000 else 500)
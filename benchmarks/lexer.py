@@ -0,0 +1,63 @@
+"""
+Mede a vazão do Lexer, em tokens por segundo, e da análise SLR(1) alimentada diretamente pelo Lexer
+
+Os tokens são os terminais de tests/Grammar/grammar_01.txt (+, *, parênteses e id), sobre uma expressão aritmética
+aleatória.
+
+Uso: python benchmarks/lexer.py [tokens]
+"""
+
+import os
+import sys
+import random
+
+from common import ROOT, timed
+
+from ER import ER
+from Lexer import Lexer
+from Grammar import Grammar
+
+LETTERS = '+'.join('abcdefghij')
+DIGITS = '+'.join('0123456789')
+
+def generate(n, seed=0):
+  """
+  Gera uma expressão aritmética aleatória, válida em grammar_01, com aproximadamente n tokens
+
+  Parameters
+  ----------
+  n: int
+    número aproximado de tokens
+  seed [default=0]: int
+    semente do gerador aleatório
+  """
+
+  rng = random.Random(seed)
+
+  aux = []
+  depth = 0
+  while True:
+    while len(aux) < n and rng.random() < 0.1:
+      aux.append('(')
+      depth += 1
+    aux.append(rng.choice('abcdefghij') + str(rng.randint(0, 99)))
+    while depth and (len(aux) >= n or rng.random() < 0.1):
+      aux.append(')')
+      depth -= 1
+    if len(aux) >= n and not depth:
+      return ' '.join(aux)
+    aux.append(rng.choice('+*'))
+
+if __name__ == '__main__':
+  n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+  lexer = Lexer([('+', ER.escape('+')), ('*', ER.escape('*')), ('(', ER.escape('(')), (')', ER.escape(')')), ('id', f'({LETTERS})({LETTERS}+{DIGITS})*')])
+  grammar = Grammar.fromFile(os.path.join(ROOT, 'tests', 'Grammar', 'grammar_01.txt'))
+  grammar.buildSLRTable()
+  text = generate(n)
+
+  (count, elapsed) = timed(lambda: sum(1 for _ in lexer.tokenize(text)))
+  print(f'Lexer:        {count} tokens em {elapsed:.3f}s ({count / elapsed:,.0f} tokens/s)')
+
+  (accepted, elapsed) = timed(lambda: grammar.readInputSLR(lexer.tokens(text)))
+  print(f'Lexer + SLR:  {count} tokens em {elapsed:.3f}s ({count / elapsed:,.0f} tokens/s), aceita: {accepted}')
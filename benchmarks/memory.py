@@ -0,0 +1,41 @@
+"""
+Compara a memória ocupada pelas representações AF (dicionários) e CompactAF (vetores CSR), em bytes por transição
+
+Uso: python benchmarks/memory.py [estados] [terminais]
+"""
+
+import sys
+import tracemalloc
+
+from common import randomDFA
+
+from CompactAF import CompactAF
+
+def measure(build):
+  """
+  Retorna o objeto construído por uma função e a memória alocada durante a construção, em bytes
+
+  Parameters
+  ----------
+  build: function
+    função que constrói o objeto
+  """
+
+  tracemalloc.start()
+  result = build()
+  (current, _) = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  return (result, current)
+
+if __name__ == '__main__':
+  n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+  k = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+  (af, dict_bytes) = measure(lambda: randomDFA(n, k))
+  (compact, compact_bytes) = measure(lambda: CompactAF.fromAF(af))
+  edges = len(compact.targets)
+
+  print(f'{n} estados, {k} terminais, {edges} transições')
+  print(f'AF:        {dict_bytes / edges:8.1f} bytes por transição')
+  print(f'CompactAF: {compact_bytes / edges:8.1f} bytes por transição')
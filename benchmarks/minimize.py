@@ -0,0 +1,93 @@
+"""
+Mede a minimização de AFDs aleatórios pelo algoritmo de Hopcroft (AF.equivalenceClasses), até 10^5 estados
+
+Para tamanhos de até 10^4 estados, também é medido o refinamento por rodadas (Moore), com assinaturas de classes
+em strings, como no algoritmo anterior (que ainda fazia uma busca linear pela classe de cada estado e recorria a
+cada rodada, não chegando a esses tamanhos), e os números de classes dos dois são comparados.
+
+Como AFDs aleatórios densos já costumam ser mínimos, também são minimizados AFDs com um número conhecido de
+junções: cada estado de um AFD aleatório, completo ou parcial, é duplicado, com as transições apontando ao acaso
+para o destino original ou para sua cópia, de forma que o resultado deve ter exatamente o tamanho do AFD mínimo
+original.
+
+Uso: python benchmarks/minimize.py [estados ...]
+"""
+
+import sys
+import random
+
+from common import randomDFA, timed
+
+from AF import AF
+
+def reference(af):
+  """
+  Retorna o número de classes de equivalência de um AFD completo, pelo refinamento anterior, em rodadas
+
+  Parameters
+  ----------
+  af: AF object
+    instância de um autômato finito determinístico e completo
+  """
+
+  classes = dict((x, int(x in af.final)) for x in af.vertices)
+  while True:
+    signatures = dict()
+    new_classes = dict()
+    for vertice in af.vertices:
+      key = str([classes[vertice]] + [classes[x[0]] if x else None for x in (af.transit(vertice, t) for t in af.terminals)])
+      new_classes[vertice] = signatures.setdefault(key, len(signatures))
+    if len(signatures) == len(set(classes.values())):
+      return len(signatures)
+    classes = new_classes
+
+def duplicate(af, seed=0):
+  """
+  Retorna um AFD equivalente com cada estado duplicado, cujas transições levam ao acaso ao destino ou à sua cópia
+
+  Parameters
+  ----------
+  af: AF object
+    instância de um autômato finito determinístico, com estados de 1 a n
+  seed [default=0]: int
+    semente do gerador aleatório
+  """
+
+  rng = random.Random(seed)
+  n = len(af.vertices)
+
+  transitions = dict()
+  for fonte in af.vertices:
+    for terminal, [destino] in af.edges(fonte):
+      for x in (fonte, fonte + n):
+        transitions.setdefault((x, destino + rng.choice((0, n))), []).append(terminal)
+
+  return AF(list(range(1, 2 * n + 1)), transitions, af.initial, list(af.final) + [x + n for x in af.final])
+
+if __name__ == '__main__':
+  sizes = [int(x) for x in sys.argv[1:]] or [1000, 10000, 100000]
+
+  print(f'{"estados":>8} | {"Hopcroft":>9} | {"classes":>8} | {"anterior":>9}')
+  for n in sizes:
+    af = AF.trim(randomDFA(n, 2, seed=n))
+    (result, elapsed) = timed(lambda: AF.equivalenceClasses(af))
+
+    previous = '-'
+    if n <= 10000:
+      (classes, aux) = timed(lambda: reference(af))
+      assert classes == len(result.vertices)
+      previous = f'{aux:8.3f}s'
+
+    print(f'{len(af.vertices):>8} | {elapsed:8.3f}s | {len(result.vertices):>8} | {previous:>9}')
+
+  print()
+  print(f'{"duplicado":>18} | {"estados":>8} | {"Hopcroft":>9} | {"classes":>8} | {"junções":>8}')
+  for n in sizes:
+    for density in (1.0, 0.8):
+      af = AF.equivalenceClasses(AF.trim(randomDFA(n, 2, seed=n, density=density)))
+      aux = duplicate(af, seed=n)
+      (result, elapsed) = timed(lambda: AF.equivalenceClasses(aux))
+      assert len(result.vertices) == len(af.vertices)
+
+      name = f'{n} ({"completo" if density == 1.0 else "parcial"})'
+      print(f'{name:>18} | {len(aux.vertices):>8} | {elapsed:8.3f}s | {len(result.vertices):>8} | {len(aux.vertices) - len(result.vertices):>8}')
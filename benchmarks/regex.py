@@ -0,0 +1,85 @@
+"""
+Mede o tempo de compilação de expressões regulares geradas em AFDs, pela função FollowPos (ER.treeToAF)
+
+É comparada a construção anterior, que guardava os estados como listas ordenadas, procurava estados novos por
+busca linear e indexava as transições por strings. São usadas as famílias (a+b)*a(a+b)^k, cujo AFD tem 2^(k+1)
+estados, e expressões aleatórias longas.
+
+Uso: python benchmarks/regex.py
+"""
+
+import random
+
+from common import timed
+
+from AF import AF
+from ER import ER
+from Tree import Tree
+
+def reference(tree):
+  """
+  Converte uma árvore de derivação para um autômato finito, pela construção anterior
+
+  Parameters
+  ----------
+  tree: Tree object
+    árvore de derivação
+  """
+
+  follow_pos = dict((x, Tree.indices(mask)) for x, mask in tree.followPos().items())
+
+  dstates = [Tree.indices(tree.root.firstPos())]
+  visited = []
+  dtran = dict()
+  while dstates:
+    visited.append(dstates.pop())
+    for terminal in set([tree.dict[x] for x in visited[-1] if tree.dict[x] != '#']):
+      union = sorted(set(y for x in visited[-1] for y in follow_pos[x] if tree.dict[x] == terminal))
+
+      if union not in visited and union not in dstates:
+        dstates.append(union)
+
+      dtran[str(visited[-1]), str(union)] = dtran.get((str(visited[-1]), str(union)), []) + [terminal]
+
+  new_states = dict((str(x), i) for i, x in enumerate(visited, 1))
+  new_transitions = dict(((new_states[fonte], new_states[destino]), value) for (fonte, destino), value in dtran.items())
+
+  return AF(list(new_states.values()), new_transitions, 1, [new_states[str(x)] for x in visited if any(tree.dict[y] == '#' for y in x)])
+
+def generate(size, seed=0):
+  """
+  Gera uma expressão regular aleatória, sobre os terminais a, b e c, com aproximadamente size símbolos
+
+  Parameters
+  ----------
+  size: int
+    número aproximado de símbolos
+  seed [default=0]: int
+    semente do gerador aleatório
+  """
+
+  rng = random.Random(seed)
+
+  aux = []
+  for _ in range(size // 4):
+    group = ''.join(rng.choice('abc') for _ in range(rng.randint(1, 3)))
+    aux.append(rng.choice([group, f'({group})*', f'({group}+{rng.choice("abc")})']))
+
+  return ''.join(aux)
+
+if __name__ == '__main__':
+  cases = [(f'(a+b)*a(a+b)^{k}', '(a+b)*a' + '(a+b)' * k, True) for k in [6, 8, 10, 12]]
+  cases += [(f'aleatória ({size})', generate(size, size), size <= 400) for size in [200, 400, 2000]]
+
+  print(f'{"expressão":>18} | {"estados":>7} | {"anterior":>9} | {"atual":>9} | {"mínimo":>9} | {"estados (mínimo)":>16}')
+  for (name, expression, compare) in cases:
+    (af, elapsed) = timed(lambda: ER(expression).toAF())
+    (minimum, minimize_time) = timed(lambda: ER(expression).toAFD(minimize=True))
+
+    previous = '-'
+    if compare:
+      (aux, previous_time) = timed(lambda: reference(ER(expression).tree))
+      assert len(aux.vertices) == len(af.vertices) and AF.equivalent(aux, af)
+      previous = f'{previous_time:8.3f}s'
+
+    print(f'{name:>18} | {len(af.vertices):>7} | {previous:>9} | {elapsed:8.3f}s | {minimize_time:8.3f}s | {len(minimum.vertices):>16}')
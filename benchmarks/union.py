@@ -0,0 +1,53 @@
+"""
+Compara a união de centenas de autômatos por AF.unionAll com a união binária repetida (AF.union)
+
+Os autômatos são os de tests/AFD/*.txt, repetidos, intercalados com AFDs pequenos que reconhecem palavras
+aleatórias (como as palavras-chave de um analisador léxico). A determinização e a minimização do resultado são
+feitas uma única vez, ao final.
+
+Uso: python benchmarks/union.py [quantidade ...]
+"""
+
+import os
+import sys
+import glob
+from functools import reduce
+
+import random
+
+from common import ROOT, randomWords, timed
+
+from AF import AF
+from AFND import AFND
+
+def word(seed):
+  """
+  Gera um AFD que reconhece uma única palavra aleatória, sobre os terminais 0 e 1
+
+  Parameters
+  ----------
+  seed: int
+    semente do gerador aleatório
+  """
+
+  rng = random.Random(seed)
+  text = ''.join(rng.choice('01') for _ in range(rng.randint(3, 10)))
+
+  return AF(list(range(1, len(text) + 2)), dict(((i + 1, i + 2), [c]) for i, c in enumerate(text)), 1, [len(text) + 1])
+
+if __name__ == '__main__':
+  sizes = [int(x) for x in sys.argv[1:]] or [100, 300, 500]
+  samples = [AF.fromFile(x) for x in sorted(glob.glob(os.path.join(ROOT, 'tests', 'AFD', '*.txt')))]
+
+  print(f'{"autômatos":>9} | {"estados":>7} | {"union":>9} | {"unionAll":>9} | {"unionAll (mínimo)":>17} | {"estados (mínimo)":>16}')
+  for count in sizes:
+    afs = [samples[i % 4] if i % 4 < len(samples) else word(i) for i in range(count)]
+
+    (folded, union_time) = timed(lambda: reduce(AF.union, afs))
+    (combined, all_time) = timed(lambda: AF.unionAll(afs))
+    (minimum, minimize_time) = timed(lambda: AF.unionAll(afs, minimize=True))
+
+    words = randomWords(sorted(set(t for af in afs for t in af.terminals)), 200, 8)
+    assert AFND(folded).readMany(words).tolist() == AFND(combined).readMany(words).tolist()
+
+    print(f'{count:>9} | {len(combined.vertices):>7} | {union_time:8.3f}s | {all_time:8.3f}s | {minimize_time:16.3f}s | {len(minimum.vertices):>16}')
@@ -1,6 +1,35 @@
 import sys
+import mmap
+import struct
 import itertools
+import numpy as np
+from array import array
+from collections import deque
 from tabulate import tabulate
+from Matcher import Matcher
+
+def shared(name, doc):
+  """
+  Cria uma propriedade armazenada na estrutura compartilhada do autômato, vista por todos os seus invólucros
+
+  Parameters
+  ----------
+  name: str
+    nome do atributo
+  doc: str
+    descrição do atributo
+  """
+
+  def get(self):
+    try:
+      return self.structure[name]
+    except KeyError:
+      raise AttributeError(name)
+
+  def set(self, value):
+    self.structure[name] = value
+
+  return property(get, set, doc=doc)
 
 class AF:
   """
@@ -16,8 +45,43 @@ class AF:
     estado inicial
   final: list
     lista de estados de aceitação
+  index: dict
+    índice de transições, no formato estado -> terminal -> destinos
+  reverse: dict
+    índice reverso de transições, no formato estado -> terminal -> origens
+  fecho: dict
+    cache dos ε-fechos dos estados, gerado por closures()
+  nondeterministic: bool
+    indica se o autômato é não-determinístico, calculado durante a indexação
+  completeness: bool
+    cache da completude do autômato, gerado por isComplete()
+  version: int
+    contador de alterações do autômato, usado para invalidar as tabelas compiladas
+  structure: dict
+    estrutura compartilhada com os invólucros (AFD, AFND) criados por view(), onde ficam todos os atributos acima
   """
 
+  # Formato binário: cabeçalho, tabela de terminais e vetores (rótulos, CSR e estados de aceitação)
+  MAGIC = b'AFB\0'
+  VERSION = 1
+  HEADER = struct.Struct('<4sHHIIIII')
+
+  __slots__ = ('structure',)
+
+  vertices = shared('vertices', 'lista com os estados do autômato')
+  vertexSet = shared('vertexSet', 'conjunto com os estados do autômato')
+  transitions = shared('transitions', 'dicionário de transições do autômato')
+  initial = shared('initial', 'estado inicial')
+  final = shared('final', 'lista de estados de aceitação')
+  terminals = shared('terminals', 'lista ordenada de terminais')
+  index = shared('index', 'índice de transições')
+  reverse = shared('reverse', 'índice reverso de transições')
+  fecho = shared('fecho', 'cache dos ε-fechos dos estados')
+  completeness = shared('completeness', 'cache da completude do autômato')
+  nondeterministic = shared('nondeterministic', 'indica se o autômato é não-determinístico')
+  searcherCache = shared('searcherCache', 'cache do buscador de ocorrências')
+  version = shared('version', 'contador de alterações do autômato')
+
   def __init__(self, vertices, transitions, initial, final):
     """
     Parameters
@@ -32,18 +96,99 @@ class AF:
       lista de estados de aceitação
     """
 
-    if not all([x in vertices for x in set(itertools.chain(*transitions))]):
+    aux = set(vertices)
+    if not aux.issuperset(itertools.chain(*transitions)):
       raise Exception('Transições entre estados inexistentes não são permitidas!')
-    if not initial in vertices:
+    if not initial in aux:
       raise Exception('Estado inicial não encontrado!')
-    if not all(x in vertices for x in final):
+    if not aux.issuperset(final):
       raise Exception('Estado(s) de aceitação não encontrado(s)!')
 
+    self.structure = dict()
     self.vertices = vertices
+    self.vertexSet = aux
     self.transitions = transitions
     self.initial = initial
     self.final = final
     self.terminals = sorted(set(itertools.chain(*transitions.values())))
+    self.buildIndex()
+
+  def buildIndex(self):
+    """
+    (Re)constrói os índices direto e reverso a partir do dicionário de transições
+
+    O não-determinismo do autômato é verificado durante a indexação e fica armazenado no objeto.
+    """
+
+    self.version = self.structure.get('version', 0) + 1
+
+    self.index = dict()
+    self.reverse = dict()
+    self.fecho = None
+    self.completeness = None
+    self.searcherCache = None
+    self.nondeterministic = '&' in self.terminals
+    for (fonte, destino), x in self.transitions.items():
+      for terminal in dict.fromkeys(x):
+        aux = self.index.setdefault(fonte, {}).setdefault(terminal, [])
+        aux.append(destino)
+        self.reverse.setdefault(destino, {}).setdefault(terminal, []).append(fonte)
+        if len(aux) > 1:
+          self.nondeterministic = True
+
+  def view(self, af):
+    """
+    Compartilha, sem cópia nem nova validação, a estrutura já indexada de outro autômato
+
+    Todos os atributos, incluindo os derivados (terminais, não-determinismo e caches), ficam em uma única estrutura,
+    de forma que alterações feitas por meio de um dos autômatos são refletidas no outro. Autômatos sem índices de
+    dicionário, como os da representação compacta, são convertidos em uma cópia, preservando a imutabilidade do
+    original.
+
+    Parameters
+    ----------
+    af: AF object
+      instância de um autômato finito
+    """
+
+    if 'index' not in af.structure:
+      af = af.toAF()
+
+    self.structure = af.structure
+
+  def addTransition(self, fonte, destino, terminal):
+    """
+    Adiciona uma transição ao autômato, mantendo os índices sincronizados
+
+    Parameters
+    ----------
+    fonte: int
+      estado de origem
+    destino: int
+      estado de destino
+    terminal: str
+      símbolo terminal
+    """
+
+    if fonte not in self.vertexSet or destino not in self.vertexSet:
+      raise Exception('Transições entre estados inexistentes não são permitidas!')
+
+    x = self.transitions.setdefault((fonte, destino), [])
+    if terminal in x:
+      return
+
+    x.append(terminal)
+    aux = self.index.setdefault(fonte, {}).setdefault(terminal, [])
+    aux.append(destino)
+    self.reverse.setdefault(destino, {}).setdefault(terminal, []).append(fonte)
+    if terminal not in self.terminals:
+      self.terminals = sorted(self.terminals + [terminal])
+    if terminal == '&':
+      self.fecho = None
+    self.completeness = None
+    self.searcherCache = None
+    self.nondeterministic = self.nondeterministic or terminal == '&' or len(aux) > 1
+    self.version += 1
 
   def transit(self, vertice, terminal):
     """
@@ -57,20 +202,220 @@ class AF:
       símbolo terminal
     """
 
-    return [ns for (cs, ns), x in self.transitions.items() if cs == vertice and terminal in x]
+    return self.structure['index'].get(vertice, {}).get(terminal, [])
+
+  def edges(self, vertice):
+    """
+    Retorna as transições que partem de um estado, como pares (terminal, destinos)
+
+    Parameters
+    ----------
+    vertice: int
+      estado atual
+    """
+
+    return self.structure['index'].get(vertice, {}).items()
+
+  def reverseEdges(self, vertice):
+    """
+    Retorna as transições que chegam a um estado, como pares (terminal, origens)
+
+    Parameters
+    ----------
+    vertice: int
+      estado atual
+    """
+
+    return self.structure['reverse'].get(vertice, {}).items()
+
+  def previous(self, vertice, terminal):
+    """
+    Retorna os possíveis estados anteriores, a partir de um terminal
+
+    Parameters
+    ----------
+    vertice: int
+      estado atual
+    terminal: str
+      símbolo terminal
+    """
+
+    return self.structure['reverse'].get(vertice, {}).get(terminal, [])
+
+  def closures(self):
+    """
+    Retorna o ε-fecho de todos os estados do autômato
+
+    Os componentes fortemente conexos do grafo de ε-transições são identificados pelo algoritmo de Tarjan, em
+    sua versão iterativa, e cada componente recebe um único fecho, compartilhado por todos os seus estados.
+    Como Tarjan emite os componentes em ordem topológica reversa, o fecho de um componente é a união de seus
+    estados com os fechos, já calculados, dos componentes sucessores. O resultado fica armazenado no autômato.
+    """
+
+    if self.fecho is not None:
+      return self.fecho
+
+    fecho = dict()
+    order = dict()
+    low = dict()
+    stack = []
+    on_stack = set()
+
+    for root in self.vertices:
+      if root in order:
+        continue
+
+      order[root] = low[root] = len(order)
+      stack.append(root)
+      on_stack.add(root)
+      work = [(root, iter(self.transit(root, '&')))]
+
+      while work:
+        (vertice, edges) = work[-1]
+        for x in edges:
+          if x not in order:
+            order[x] = low[x] = len(order)
+            stack.append(x)
+            on_stack.add(x)
+            work.append((x, iter(self.transit(x, '&'))))
+            break
+          elif x in on_stack:
+            low[vertice] = min(low[vertice], order[x])
+        else:
+          work.pop()
+          if work:
+            low[work[-1][0]] = min(low[work[-1][0]], low[vertice])
+
+          if low[vertice] == order[vertice]:
+            component = []
+            while not component or component[-1] != vertice:
+              component.append(stack.pop())
+              on_stack.discard(component[-1])
+
+            aux = set(component)
+            for x in component:
+              for y in self.transit(x, '&'):
+                if y not in aux:
+                  aux |= fecho[y]
+
+            aux = frozenset(aux)
+            for x in component:
+              fecho[x] = aux
+
+    self.fecho = fecho
+    return fecho
 
   def isAFND(self):
     """Verifica se o autômato é não-determinístico"""
 
-    if '&' in self.terminals:
-      return True
+    return self.nondeterministic
+
+  def isComplete(self):
+    """Verifica se todo estado possui transição por todo terminal, armazenando o resultado no objeto"""
+
+    if self.completeness is None:
+      terminals = [t for t in self.terminals if t != '&']
+      self.completeness = all(all(self.transit(vertice, t) for t in terminals) for vertice in self.vertices)
+
+    return self.completeness
 
-    for (vertice, terminal) in itertools.product(self.vertices, self.terminals):
-      aux = self.transit(vertice, terminal)
-      if len(aux) > 1:
-        return True
+  def toCompact(self):
+    """Converte o autômato para a representação compacta, baseada em vetores"""
 
-    return False
+    from CompactAF import CompactAF
+
+    return CompactAF.fromAF(self)
+
+  def matcher(self):
+    """
+    Retorna um reconhecedor incremental para o autômato
+
+    Vale para os autômatos que implementam o protocolo de reconhecimento (startState, readChunk, isAccepting e
+    isDead), como AFD, AFND e LazyAFD.
+    """
+
+    return Matcher(self)
+
+  def readInput(self, input):
+    """
+    Verifica se o autômato reconhece determinada cadeia de entrada
+
+    Parameters
+    ----------
+    input: str
+      cadeia de caracteres de entrada
+    """
+
+    return self.isAccepting(self.readChunk(self.startState(), input))
+
+  def searcher(self):
+    """Retorna o buscador de ocorrências da linguagem do autômato em textos, construído uma única vez"""
+
+    if self.searcherCache is None:
+      from Searcher import Searcher
+
+      self.searcherCache = Searcher(self)
+
+    return self.searcherCache
+
+  def search(self, text, pos=0):
+    """
+    Retorna a primeira ocorrência (leftmost-longest) da linguagem do autômato em um texto, como um par (início, fim)
+
+    Parameters
+    ----------
+    text: str or bytes
+      texto de entrada
+    pos [default=0]: int
+      posição a partir da qual a busca é feita
+    """
+
+    return self.searcher().search(text, pos)
+
+  def finditer(self, text, pos=0):
+    """
+    Gera as ocorrências (leftmost-longest) não sobrepostas da linguagem do autômato em um texto, como pares (início, fim)
+
+    Parameters
+    ----------
+    text: str or bytes
+      texto de entrada
+    pos [default=0]: int
+      posição a partir da qual a busca é feita
+    """
+
+    return self.searcher().finditer(text, pos)
+
+  @staticmethod
+  def encode(inputs, symbols):
+    """
+    Converte, de uma só vez, um lote de cadeias de entrada em um vetor de códigos de terminais, para o reconhecimento em lote
+
+    As cadeias são concatenadas e codificadas com um único mapeamento vetorizado; o código len(symbols) representa
+    qualquer símbolo desconhecido. São retornados o vetor de códigos e, com as cadeias ordenadas da maior para a
+    menor, seus tamanhos, deslocamentos no vetor e a ordem original.
+
+    Parameters
+    ----------
+    inputs: list
+      cadeias de caracteres de entrada
+    symbols: dict
+      códigos dos terminais, no formato terminal -> código
+    """
+
+    chars = [t for t in symbols if len(t) == 1]
+    lookup = np.full(max(map(ord, chars), default=0) + 2, len(symbols), dtype=np.int64)
+    for t in chars:
+      lookup[ord(t)] = symbols[t]
+
+    data = np.frombuffer(''.join(inputs).encode('utf-32-le'), dtype=np.uint32)
+    codes = lookup[np.minimum(data, len(lookup) - 1)]
+
+    lengths = np.fromiter(map(len, inputs), dtype=np.int64, count=len(inputs))
+    offsets = np.cumsum(lengths) - lengths
+    order = np.argsort(-lengths, kind='stable')
+
+    return (codes, lengths[order], offsets[order], order)
 
   def toTable(self):
     """Retorna o autômato em formato de tabela de transições"""
@@ -80,16 +425,18 @@ class AF:
     if not data:
       raise Exception('Autômato vazio!')
 
+    vertices = self.vertices
+    final = set(self.final)
     for terminal in self.terminals:
-      data[terminal] = [', '.join(map(str, self.transit(vertice, terminal))).strip() or '-' for vertice in self.vertices]
+      data[terminal] = [', '.join(map(str, self.transit(vertice, terminal))).strip() or '-' for vertice in vertices]
 
-    index = len(self.vertices)*['']
-    for i in range(len(self.vertices)):
-      if self.vertices[i] == self.initial:
+    index = len(vertices)*['']
+    for i in range(len(vertices)):
+      if vertices[i] == self.initial:
         index[i] += '-> '
-      if self.vertices[i] in self.final:
+      if vertices[i] in final:
         index[i] += '* '
-      index[i] += str(self.vertices[i])
+      index[i] += str(vertices[i])
 
     return tabulate(data, headers='keys', showindex=index, tablefmt='presto', colalign=('right',))
 
@@ -114,7 +461,7 @@ class AF:
       self.printAF()
       sys.stdout = original_stdout
 
-  def saveToFile(self, arquivo):
+  def saveToFile(self, arquivo, binary=False):
     """
     Salva o autômato finito em um arquivo especificado
     
@@ -122,8 +469,13 @@ class AF:
     ----------
     arquivo: str
       caminho do arquivo
+    binary [default=False]: bool
+      salva o autômato no formato binário compacto
     """
 
+    if binary:
+      return self.saveToBinary(arquivo)
+
     original_stdout = sys.stdout 
     with open(arquivo, 'w') as f:
       sys.stdout = f
@@ -138,37 +490,248 @@ class AF:
       
       sys.stdout = original_stdout
 
+  def saveToBinary(self, arquivo):
+    """
+    Salva o autômato finito em um arquivo, no formato binário compacto
+
+    O arquivo contém um cabeçalho, a tabela de terminais e, alinhados em 8 bytes e em little-endian, os rótulos
+    dos estados (int64), as transições em formato CSR (deslocamentos, terminais e destinos, uint32) e os índices
+    dos estados de aceitação (uint32).
+
+    Parameters
+    ----------
+    arquivo: str
+      caminho do arquivo
+    """
+
+    states = list(self.vertices)
+    ids = dict(zip(states, range(len(states))))
+    symbols = dict(zip(self.terminals, range(len(self.terminals))))
+
+    offsets = array('I', [0])
+    codes = array('I')
+    targets = array('I')
+    for vertice in states:
+      for terminal, edges in sorted(self.edges(vertice)):
+        for x in edges:
+          codes.append(symbols[terminal])
+          targets.append(ids[x])
+      offsets.append(len(targets))
+
+    sections = [array('q', states), offsets, codes, targets, array('I', sorted(set(ids[x] for x in self.final)))]
+    if sys.byteorder != 'little':
+      [x.byteswap() for x in sections]
+
+    alphabet = b''.join(struct.pack('<H', len(x)) + x for x in [t.encode() for t in self.terminals])
+
+    with open(arquivo, 'wb') as f:
+      f.write(AF.HEADER.pack(AF.MAGIC, AF.VERSION, 0, len(states), len(self.terminals), len(targets), len(sections[-1]), ids[self.initial]))
+      f.write(alphabet + bytes(-(AF.HEADER.size + len(alphabet)) % 8))
+      for section in sections:
+        data = section.tobytes()
+        f.write(data + bytes(-len(data) % 8))
+
   @staticmethod
-  def removeUnreachable(af):
+  def readBinary(arquivo):
     """
-    Remove estados inalcançáveis de um autômato finito
-    
+    Mapeia em memória um arquivo no formato binário compacto e retorna suas seções, sem copiá-las
+
+    Retorna um dicionário com os terminais, o estado inicial e os vetores labels, offsets, symbols, targets e final,
+    como memoryviews sobre o arquivo mapeado.
+
+    Parameters
+    ----------
+    arquivo: str
+      caminho do arquivo
+    """
+
+    try:
+      with open(arquivo, 'rb') as f:
+        data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+      (magic, version, _, n, k, e, m, initial) = AF.HEADER.unpack_from(data)
+    except (OSError, ValueError, struct.error):
+      raise Exception('Arquivo inválido!')
+
+    if magic != AF.MAGIC:
+      raise Exception('Arquivo inválido!')
+    if version != AF.VERSION:
+      raise Exception(f'Versão {version} do formato binário não suportada!')
+
+    position = AF.HEADER.size
+    terminals = []
+    try:
+      for _ in range(k):
+        (size,) = struct.unpack_from('<H', data, position)
+        terminals.append(bytes(data[position + 2:position + 2 + size]).decode())
+        position += 2 + size
+    except (struct.error, UnicodeDecodeError):
+      raise Exception('Arquivo inválido!')
+    position += -position % 8
+
+    sections = dict()
+    for (name, code, size, length) in [('labels', 'q', 8, n), ('offsets', 'I', 4, n + 1), ('symbols', 'I', 4, e), ('targets', 'I', 4, e), ('final', 'I', 4, m)]:
+      section = data[position:position + size * length]
+      if len(section) != size * length:
+        raise Exception('Arquivo inválido!')
+      if sys.byteorder == 'little':
+        sections[name] = section.cast(code)
+      else:
+        sections[name] = array(code)
+        sections[name].frombytes(section)
+        sections[name].byteswap()
+      position += size * length + (-size * length % 8)
+
+    # Índices fora dos limites tornariam o arquivo inconsistente com o próprio cabeçalho
+    (offsets, symbols, targets, final) = (sections['offsets'], sections['symbols'], sections['targets'], sections['final'])
+    if not initial < n or offsets[0] != 0 or offsets[n] != e or any(offsets[i] > offsets[i + 1] for i in range(n)):
+      raise Exception('Arquivo inválido!')
+    if (e and (max(targets) >= n or max(symbols) >= k)) or (m and max(final) >= n):
+      raise Exception('Arquivo inválido!')
+
+    sections['terminals'] = terminals
+    sections['initial'] = initial
+
+    return sections
+
+  @staticmethod
+  def fromBinary(arquivo):
+    """
+    Lê um arquivo no formato binário compacto e retorna um autômato finito
+
+    Parameters
+    ----------
+    arquivo: str
+      caminho do arquivo
+    """
+
+    data = AF.readBinary(arquivo)
+    (labels, offsets, symbols, targets, terminals) = (data['labels'], data['offsets'], data['symbols'], data['targets'], data['terminals'])
+
+    vertices = labels.tolist()
+    transitions = dict()
+    for i in range(len(vertices)):
+      for j in range(offsets[i], offsets[i + 1]):
+        transitions.setdefault((vertices[i], vertices[targets[j]]), []).append(terminals[symbols[j]])
+
+    return AF(vertices, transitions, vertices[data['initial']], [vertices[x] for x in data['final']])
+
+  def accessible(self):
+    """Retorna o conjunto de estados alcançáveis a partir do estado inicial, por meio de uma busca em largura"""
+
+    visited = {self.initial}
+    queue = deque([self.initial])
+    while queue:
+      for (_, edges) in self.edges(queue.popleft()):
+        for x in edges:
+          if x not in visited:
+            visited.add(x)
+            queue.append(x)
+
+    return visited
+
+  def coaccessible(self):
+    """Retorna o conjunto de estados que alcançam algum estado de aceitação, por meio de uma busca em largura reversa"""
+
+    visited = set(self.final)
+    queue = deque(visited)
+    while queue:
+      for (_, edges) in self.reverseEdges(queue.popleft()):
+        for x in edges:
+          if x not in visited:
+            visited.add(x)
+            queue.append(x)
+
+    return visited
+
+  def isEmpty(self):
+    """Verifica se a linguagem reconhecida pelo autômato é vazia"""
+
+    return self.witness() is None
+
+  def witness(self):
+    """
+    Retorna a menor cadeia aceita pelo autômato, ou None, caso sua linguagem seja vazia
+
+    A busca é feita em largura, com ε-transições de custo zero, e termina no primeiro estado de aceitação encontrado.
+    """
+
+    final = set(self.final)
+    parents = {self.initial: None}
+    distance = {self.initial: 0}
+    done = set()
+    queue = deque([self.initial])
+    while queue:
+      vertice = queue.popleft()
+      if vertice in done:
+        continue
+      if vertice in final:
+        return AF.path(parents, vertice)
+      done.add(vertice)
+
+      for terminal, edges in self.edges(vertice):
+        cost = 0 if terminal == '&' else 1
+        for x in edges:
+          if distance[vertice] + cost < distance.get(x, float('inf')):
+            distance[x] = distance[vertice] + cost
+            parents[x] = (vertice, terminal)
+            queue.appendleft(x) if cost == 0 else queue.append(x)
+
+    return None
+
+  @staticmethod
+  def path(parents, node):
+    """
+    Reconstrói a cadeia que leva do nó inicial de uma busca até determinado nó
+
+    Parameters
+    ----------
+    parents: dict
+      dicionário de predecessores, no formato nó -> (nó anterior, terminal)
+    node: object
+      nó final da busca
+    """
+
+    word = []
+    while parents[node]:
+      (node, terminal) = parents[node]
+      if terminal != '&':
+        word.append(terminal)
+
+    return ''.join(reversed(word))
+
+  @staticmethod
+  def restrict(af, vertices):
+    """
+    Retorna o subautômato induzido por um conjunto de estados
+
+    O estado inicial é sempre mantido, mesmo que não pertença ao conjunto.
+
     Parameters
     ----------
     af: AF object
       instância de um autômato finito
+    vertices: set
+      conjunto de estados mantidos
     """
 
-    def private(vertice, visited):
-      """
-      Através de recursão, retorna os estados alcançáveis do autômato
-      
-      Parameters
-      ----------
-      vertice: int
-        vértice inicial para realizar a busca
-      visited: list
-        lista de vértices já visitados, pelo algoritmo
-      """
+    vertices = vertices | {af.initial}
+    new_vertices = [vertice for vertice in af.vertices if vertice in vertices]
+    new_transitions = dict([((fonte, destino), value) for ((fonte, destino), value) in af.transitions.items() if fonte in vertices and destino in vertices])
 
-      visited.append(vertice)
-      [private(destino, visited) for (fonte, destino) in af.transitions.keys() if fonte == vertice and destino not in visited]
-      return sorted(visited)
+    return AF(new_vertices, new_transitions, af.initial, [vertice for vertice in af.final if vertice in vertices])
+
+  @staticmethod
+  def removeUnreachable(af):
+    """
+    Remove estados inalcançáveis de um autômato finito
     
-    new_vertices = private(af.initial, [])
-    new_transitions = dict([((fonte, destino), value) for ((fonte, destino), value) in af.transitions.items() if fonte in new_vertices and destino in new_vertices])
+    Parameters
+    ----------
+    af: AF object
+      instância de um autômato finito
+    """
 
-    return AF(new_vertices, new_transitions, af.initial, [vertice for vertice in af.final if vertice in new_vertices])
+    return AF.restrict(af, af.accessible())
 
   @staticmethod
   def removeDead(af):
@@ -181,88 +744,111 @@ class AF:
       instância de um autômato finito
     """
 
-    def private(vertices, visited):
-      """
-      Através de recursão, retorna os estados não mortos do autômato
-      
-      Parameters
-      ----------
-      vertices: list
-        lista de estados para realizar a busca
-      visited: list
-        lista de vértices já visitados, pelo algoritmo
-      """
+    return AF.restrict(af, af.coaccessible())
 
-      if vertices:
-        visited += list(set(vertices))
-        private([fonte for (fonte, destino) in af.transitions.keys() if destino in vertices and fonte not in visited], visited)
-      return sorted(set(visited))
+  @staticmethod
+  def trim(af):
+    """
+    Remove, em uma única etapa, os estados inalcançáveis e mortos de um autômato finito
     
-    new_vertices = private(af.final, [])
-    new_transitions = dict([((fonte, destino), value) for ((fonte, destino), value) in af.transitions.items() if fonte in new_vertices and destino in new_vertices])
+    Parameters
+    ----------
+    af: AF object
+      instância de um autômato finito
+    """
 
-    return AF(new_vertices, new_transitions, af.initial, [vertice for vertice in af.final if vertice in new_vertices])
+    return AF.restrict(af, af.accessible() & af.coaccessible())
 
   @staticmethod
   def equivalenceClasses(af):
     """
-    Remove estados com mesma classe de equivalência de um autômato finito
-    
+    Remove estados com mesma classe de equivalência de um autômato finito determinístico
+
+    As classes são obtidas pelo algoritmo de refinamento de partições de Hopcroft, em O(n·|Σ|·log n). O autômato
+    é completado com um estado morto implícito, que é descartado ao final, junto com os estados de sua classe.
+
     Parameters
     ----------
     af: AF object
-      instância de um autômato finito
+      instância de um autômato finito determinístico
     """
 
-    def getKey(vertice, classes):
-      """
-      Retorna a classe de determinado estado
-      
-      Parameters
-      ----------
-      vertice: int
-        estado do autômato
-      classes: dict
-        dicionário de classes do autômato
-      """
+    states = list(af.vertices)
+    ids = dict(zip(states, range(len(states))))
+    terminals = [t for t in af.terminals if t != '&']
+    sink = len(states)
 
-      for (key, value) in classes.items(): 
-        if vertice in value: return key
+    # Predecessores de cada estado, por terminal, incluindo o estado morto implícito
+    inverse = [[[] for _ in range(sink + 1)] for _ in terminals]
+    for c, terminal in enumerate(terminals):
+      for q, vertice in enumerate(states):
+        destino = af.transit(vertice, terminal)
+        inverse[c][ids[destino[0]] if destino else sink].append(q)
+      inverse[c][sink].append(sink)
 
-    def private(classes):
-      """
-      Através de recursão, separa os estados do autômato em classes de equivalência
-      
-      Parameters
-      ----------
-      classes: dict
-        dicionário de classes do autômato
-      """
+    final = set(ids[x] for x in af.final)
+    blocks = [set(range(sink + 1)) - final, set(final)]
+    blocks = [x for x in blocks if x]
+    block = [0] * (sink + 1)
+    for b, members in enumerate(blocks):
+      for q in members:
+        block[q] = b
+
+    smallest = min(range(len(blocks)), key=lambda b: len(blocks[b]))
+    waiting = set((smallest, c) for c in range(len(terminals))) if len(blocks) > 1 else set()
+    stack = list(waiting)
 
-      new_classes = dict()
-      new_classes_dict = dict()
-      for vertice in af.vertices:
-        aux = [x for terminal in af.terminals for x in sorted(af.transit(vertice, terminal)) or [0]]
-        index = str([getKey(vertice, classes)] + [getKey(x, classes) or 0 for x in aux])
-        new_classes_dict[index] = sorted(new_classes_dict.get(index, []) + [vertice])
-      for i in range(1, len(new_classes_dict) + 1):
-        new_classes[i] = new_classes_dict[list(new_classes_dict.keys())[i - 1]]
-      return new_classes if len(new_classes) == len(classes) else private(new_classes)
+    while stack:
+      (b, c) = stack.pop()
+      waiting.discard((b, c))
 
-    classes = private({1: set(af.vertices) ^ set(af.final), 2: af.final})
+      touched = dict()
+      for q in blocks[b]:
+        for p in inverse[c][q]:
+          touched.setdefault(block[p], set()).add(p)
+
+      for (y, members) in touched.items():
+        if len(members) == len(blocks[y]):
+          continue
+
+        blocks[y] -= members
+        z = len(blocks)
+        blocks.append(members)
+        for q in members:
+          block[q] = z
+
+        for d in range(len(terminals)):
+          if (y, d) in waiting:
+            aux = z
+          else:
+            aux = z if len(members) <= len(blocks[y]) else y
+          waiting.add((aux, d))
+          stack.append((aux, d))
+
+    # Numera as classes pela ordem de seus primeiros estados, descartando a classe do estado morto
+    classes = dict()
+    for q in range(sink):
+      if block[q] not in classes and (block[q] != block[sink] or block[q] == block[ids[af.initial]]):
+        classes[block[q]] = len(classes) + 1
 
     new_transitions = dict()
     for ((fonte, destino), value) in af.transitions.items():
-      fonte = getKey(fonte, classes)
-      destino = getKey(destino, classes)
-      new_transitions[(fonte, destino)] = new_transitions.get((fonte, destino), []) + value
+      fonte = classes.get(block[ids[fonte]])
+      destino = classes.get(block[ids[destino]])
+      if fonte and destino:
+        aux = new_transitions.setdefault((fonte, destino), [])
+        aux += [x for x in value if x not in aux]
 
-    return AF(list(classes.keys()), new_transitions, getKey(af.initial, classes), [getKey(final, classes) for final in af.final])
+    new_final = sorted(set(classes[block[q]] for q in final if block[q] in classes))
+
+    return AF(list(classes.values()), new_transitions, classes[block[ids[af.initial]]], new_final)
 
   @staticmethod
   def minimize(af):
     """
     Faz a minimização de estados de um autômato finito
+
+    Autômatos não-determinísticos são determinizados antes da minimização.
     
     Parameters
     ----------
@@ -270,7 +856,7 @@ class AF:
       instância de um autômato finito
     """
 
-    return AF.equivalenceClasses(AF.removeDead(AF.removeUnreachable(af)))
+    return AF.equivalenceClasses(AF.trim(AF.deterministic(af)))
 
   @staticmethod
   def union(AF1, AF2):
@@ -296,6 +882,167 @@ class AF:
 
     return AF(AF1.vertices + nv, nt, total, AF1.final + nf)
 
+  @staticmethod
+  def unionAll(afs, determinize=False, minimize=False):
+    """
+    Faz a união de vários autômatos finitos, em uma única etapa
+
+    Cada autômato recebe, uma única vez, um intervalo próprio de índices, e um único estado inicial (1) se liga
+    aos estados iniciais de todos eles por ε-transições. A determinização e a minimização, quando solicitadas,
+    são feitas apenas sobre o autômato final.
+
+    Parameters
+    ----------
+    afs: iterable
+      autômatos finitos a serem unidos
+    determinize [default=False]: bool
+      determiniza o autômato resultante
+    minimize [default=False]: bool
+      minimiza o autômato resultante
+    """
+
+    new_vertices = [1]
+    new_transitions = dict()
+    new_final = []
+
+    for af in afs:
+      ids = dict(zip(af.vertices, range(len(new_vertices) + 1, len(new_vertices) + len(af.vertices) + 1)))
+      new_vertices += ids.values()
+      new_final += [ids[x] for x in af.final]
+      for ((fonte, destino), value) in af.transitions.items():
+        new_transitions[ids[fonte], ids[destino]] = list(value)
+      new_transitions.setdefault((1, ids[af.initial]), []).append('&')
+
+    af = AF(new_vertices, new_transitions, 1, new_final)
+
+    if minimize:
+      return AF.minimize(af)
+    if determinize:
+      return AF.deterministic(af)
+    return af
+
+  @staticmethod
+  def product(AF1, AF2, accept, determinize=(False, False)):
+    """
+    Constrói, a partir do par de estados iniciais, apenas os pares de estados alcançáveis do produto de dois autômatos
+
+    As ε-transições são eliminadas durante a construção, por meio dos ε-fechos de cada autômato. Um componente
+    sem transição por determinado terminal, ou que não alcança estados de aceitação, passa para um estado morto
+    implícito (None), sem que o autômato seja completado. Pares que não podem mais ser aceitos, segundo a função
+    de aceitação, são descartados assim que encontrados. Quando a função de aceitação depende do estado morto
+    de um componente (como em complementos), esse componente deve ser determinístico ou ser determinizado sob
+    demanda: seus estados passam a ser conjuntos ε-fechados de estados vivos, criados apenas quando alcançados
+    no produto, e o conjunto vazio corresponde ao estado morto implícito.
+
+    Parameters
+    ----------
+    AF1: AF object
+      instância de um autômato finito
+    AF2: AF object
+      instância de um autômato finito
+    accept: function
+      função que, dadas as aceitações de cada componente, indica se o par é de aceitação
+    determinize [default=(False, False)]: tuple
+      indica, para cada componente, se seus subconjuntos de estados devem ser construídos sob demanda
+    """
+
+    components = [(af, af.closures(), af.coaccessible(), set(af.final), subsets) for af, subsets in zip((AF1, AF2), determinize)]
+
+    def canonical(x, component):
+      """
+      Substitui estados mortos pelo estado morto implícito e, em componentes determinizados, estados por conjuntos
+
+      Parameters
+      ----------
+      x: int or iterable
+        estado de um componente ou, em componentes determinizados, estados alcançados
+      component: tuple
+        autômato, ε-fechos, estados vivos, estados de aceitação e determinização do componente
+      """
+
+      (_, fecho, live, _, subsets) = component
+      if subsets:
+        return frozenset(y for z in x for y in fecho[z] if y in live) or None
+      return x if x in live else None
+
+    def isLive(pair):
+      """
+      Verifica se algum sufixo ainda pode levar o par a um estado de aceitação
+
+      Parameters
+      ----------
+      pair: tuple
+        par de estados do produto
+      """
+
+      options = [(False, True) if x is not None else (False,) for x in pair]
+      return any(accept(x, y) for x in options[0] for y in options[1])
+
+    def isFinal(x, component):
+      """
+      Verifica se o ε-fecho de um estado de um componente contém algum estado de aceitação
+
+      Parameters
+      ----------
+      x: int or frozenset
+        estado de um componente
+      component: tuple
+        autômato, ε-fechos, estados vivos, estados de aceitação e determinização do componente
+      """
+
+      if x is None:
+        return False
+      return not component[3].isdisjoint(x if component[4] else component[1][x])
+
+    def moves(x, terminal, component):
+      """
+      Retorna os estados alcançados por um componente, a partir de um estado e um terminal
+
+      Parameters
+      ----------
+      x: int or frozenset
+        estado de um componente
+      terminal: str
+        símbolo terminal
+      component: tuple
+        autômato, ε-fechos, estados vivos, estados de aceitação e determinização do componente
+      """
+
+      if x is None:
+        return [None]
+
+      (af, fecho, _, _, subsets) = component
+      if subsets:
+        return [canonical([y for z in x for y in af.transit(z, terminal)], component)]
+
+      aux = dict.fromkeys(canonical(y, component) for z in fecho[x] for y in af.transit(z, terminal))
+      return list(aux) or [None]
+
+    terminals = sorted(set(AF1.terminals + AF2.terminals) - {'&'})
+    initial = tuple(canonical([component[0].initial] if component[4] else component[0].initial, component) for component in components)
+
+    new_vertices = {initial: 1}
+    new_transitions = dict()
+    queue = deque([initial] if isLive(initial) else [])
+    while queue:
+      pair = queue.popleft()
+      fonte = new_vertices[pair]
+      for terminal in terminals:
+        for x in moves(pair[0], terminal, components[0]):
+          for y in moves(pair[1], terminal, components[1]):
+            if not isLive((x, y)):
+              continue
+
+            if (x, y) not in new_vertices:
+              new_vertices[x, y] = len(new_vertices) + 1
+              queue.append((x, y))
+
+            new_transitions.setdefault((fonte, new_vertices[x, y]), []).append(terminal)
+
+    new_final = [i for (x, y), i in new_vertices.items() if accept(isFinal(x, components[0]), isFinal(y, components[1]))]
+
+    return AF(list(new_vertices.values()), new_transitions, 1, new_final)
+
   @staticmethod
   def intersection(AF1, AF2):
     """
@@ -309,32 +1056,243 @@ class AF:
       instância de um autômato finito
     """
 
-    new_vertices = list(itertools.product(AF1.vertices, AF2.vertices))
-    new_vertices_dict = dict(zip(new_vertices, range(1, len(new_vertices) + 1)))
-    new_initial = new_vertices_dict[(AF1.initial, AF2.initial)]
-    new_final = [new_vertices_dict[(final_af1, final_af2)] for final_af1 in AF1.final for final_af2 in AF2.final]
+    return AF.product(AF1, AF2, lambda x, y: x and y)
 
-    new_transitions = dict()
-    for (vertice1, vertice2) in new_vertices:
-      for terminal in set(AF1.terminals + AF2.terminals):
-        af1_transition = AF1.transit(vertice1, terminal)
-        af2_transition = AF2.transit(vertice2, terminal)
-        fonte = new_vertices_dict[(vertice1, vertice2)]
-
-        if terminal == '&':
-          for x in af1_transition:
-            destino = new_vertices_dict[(x, vertice2)]
-            new_transitions[(fonte, destino)] = new_transitions.get((fonte, destino), []) + [terminal]
-          for x in af2_transition:
-            destino = new_vertices_dict[(vertice1, x)]
-            new_transitions[(fonte, destino)] = new_transitions.get((fonte, destino), []) + [terminal]
-
-        elif af1_transition and af2_transition:
-          for x in list(itertools.product(af1_transition, af2_transition)):
-            destino = new_vertices_dict[x]
-            new_transitions[(fonte, destino)] = new_transitions.get((fonte, destino), []) + [terminal]
-
-    return AF(range(1, len(new_vertices) + 1), new_transitions, new_initial, new_final)
+  @staticmethod
+  def deterministic(af):
+    """
+    Retorna o próprio autômato, caso seja determinístico, ou sua versão determinizada
+
+    Parameters
+    ----------
+    af: AF object
+      instância de um autômato finito
+    """
+
+    if not af.isAFND():
+      return af
+
+    from AFND import AFND
+
+    return AFND(af).toAFD()
+
+  @staticmethod
+  def difference(AF1, AF2):
+    """
+    Faz a diferença entre dois autômatos finitos, reconhecendo as cadeias aceitas por AF1 e rejeitadas por AF2
+
+    AF2 é determinizado e completado sob demanda, durante a construção do produto, por meio de conjuntos de
+    estados e do estado morto implícito.
+
+    Parameters
+    ----------
+    AF1: AF object
+      instância de um autômato finito
+    AF2: AF object
+      instância de um autômato finito
+    """
+
+    return AF.product(AF1, AF2, lambda x, y: x and not y, (False, AF2.isAFND()))
+
+  @staticmethod
+  def symmetricDifference(AF1, AF2):
+    """
+    Faz a diferença simétrica entre dois autômatos finitos, reconhecendo as cadeias aceitas por apenas um deles
+
+    Os dois autômatos são determinizados sob demanda, durante a construção do produto.
+    
+    Parameters
+    ----------
+    AF1: AF object
+      instância de um autômato finito
+    AF2: AF object
+      instância de um autômato finito
+    """
+
+    return AF.product(AF1, AF2, lambda x, y: x != y, (AF1.isAFND(), AF2.isAFND()))
+
+  @staticmethod
+  def complement(af, terminals=None):
+    """
+    Faz o complemento de um autômato finito, em relação a um alfabeto
+
+    Parameters
+    ----------
+    af: AF object
+      instância de um autômato finito
+    terminals [default=None]: list
+      alfabeto do complemento; por padrão, os terminais do autômato
+    """
+
+    terminals = [t for t in (terminals or af.terminals) if t != '&']
+    universal = AF([1], {(1, 1): terminals} if terminals else {}, 1, [1])
+
+    return AF.difference(universal, af)
+
+  @staticmethod
+  def includes(AF1, AF2):
+    """
+    Verifica se a linguagem de AF1 está contida na linguagem de AF2, sem construir o produto
+
+    Parameters
+    ----------
+    AF1: AF object
+      instância de um autômato finito
+    AF2: AF object
+      instância de um autômato finito
+    """
+
+    return AF.inclusionCounterexample(AF1, AF2) is None
+
+  @staticmethod
+  def inclusionCounterexample(AF1, AF2):
+    """
+    Retorna a menor cadeia aceita por AF1 e rejeitada por AF2, ou None, caso a linguagem de AF1 esteja contida na de AF2
+
+    A busca é feita em largura sobre pares (estado de AF1, conjunto de estados de AF2), descartando pares
+    subsumidos por algum par já visitado com o mesmo estado de AF1 e um subconjunto de estados de AF2 (antichains).
+
+    Parameters
+    ----------
+    AF1: AF object
+      instância de um autômato finito
+    AF2: AF object
+      instância de um autômato finito
+    """
+
+    fecho1 = AF1.closures()
+    fecho2 = AF2.closures()
+    final1 = set(AF1.final)
+    final2 = set(AF2.final)
+    terminals = sorted(set(AF1.terminals) - {'&'})
+
+    def step(vertices, terminal):
+      """
+      Retorna o ε-fecho dos estados de AF2 alcançados a partir de um conjunto de estados e um terminal
+
+      Parameters
+      ----------
+      vertices: frozenset
+        conjunto de estados de AF2
+      terminal: str
+        símbolo terminal
+      """
+
+      return frozenset(y for vertice in vertices for x in AF2.transit(vertice, terminal) for y in fecho2[x])
+
+    initial = (AF1.initial, frozenset(fecho2[AF2.initial]))
+    antichain = {AF1.initial: [initial[1]]}
+    parents = {initial: None}
+    queue = deque([initial])
+    while queue:
+      (vertice, vertices) = node = queue.popleft()
+      if not final1.isdisjoint(fecho1[vertice]) and final2.isdisjoint(vertices):
+        return AF.path(parents, node)
+
+      for terminal in terminals:
+        aux = step(vertices, terminal)
+        for x in set(y for z in fecho1[vertice] for y in AF1.transit(z, terminal)):
+          if any(visited <= aux for visited in antichain.get(x, [])):
+            continue
+
+          antichain[x] = [visited for visited in antichain.get(x, []) if not aux <= visited] + [aux]
+          parents[x, aux] = (node, terminal)
+          queue.append((x, aux))
+
+    return None
+
+  @staticmethod
+  def equivalent(AF1, AF2):
+    """
+    Verifica se dois autômatos finitos reconhecem a mesma linguagem, sem construir o produto
+
+    Parameters
+    ----------
+    AF1: AF object
+      instância de um autômato finito
+    AF2: AF object
+      instância de um autômato finito
+    """
+
+    return AF.counterexample(AF1, AF2) is None
+
+  @staticmethod
+  def counterexample(AF1, AF2):
+    """
+    Retorna a menor cadeia aceita por apenas um dos autômatos finitos, ou None, caso sejam equivalentes
+
+    Para autômatos determinísticos é usado o algoritmo de Hopcroft-Karp, com union-find, e, para os demais, a
+    inclusão nos dois sentidos.
+
+    Parameters
+    ----------
+    AF1: AF object
+      instância de um autômato finito
+    AF2: AF object
+      instância de um autômato finito
+    """
+
+    if AF1.isAFND() or AF2.isAFND():
+      witnesses = [x for x in (AF.inclusionCounterexample(AF1, AF2), AF.inclusionCounterexample(AF2, AF1)) if x is not None]
+      return min(witnesses, key=len) if witnesses else None
+
+    final1 = set(AF1.final)
+    final2 = set(AF2.final)
+    terminals = sorted(set(AF1.terminals + AF2.terminals))
+
+    classes = dict()
+    def find(x):
+      """
+      Retorna o representante da classe de um estado, comprimindo o caminho
+
+      Parameters
+      ----------
+      x: tuple
+        estado, identificado pelo autômato de origem
+      """
+
+      root = x
+      while classes.get(root, root) != root:
+        root = classes[root]
+      while x != root:
+        (classes[x], x) = (root, classes.get(x, x))
+      return root
+
+    def move(af, vertice, terminal):
+      """
+      Retorna o próximo estado de um autômato determinístico, ou None para o estado morto implícito
+
+      Parameters
+      ----------
+      af: AF object
+        instância de um autômato finito determinístico
+      vertice: int
+        estado atual
+      terminal: str
+        símbolo terminal
+      """
+
+      aux = af.transit(vertice, terminal) if vertice is not None else []
+      return aux[0] if aux else None
+
+    initial = (AF1.initial, AF2.initial)
+    classes[1, AF1.initial] = (2, AF2.initial)
+    parents = {initial: None}
+    queue = deque([initial])
+    while queue:
+      (x, y) = node = queue.popleft()
+      if (x in final1) != (y in final2):
+        return AF.path(parents, node)
+
+      for terminal in terminals:
+        pair = (move(AF1, x, terminal), move(AF2, y, terminal))
+        (a, b) = (find((1, pair[0])), find((2, pair[1])))
+        if a != b:
+          classes[a] = b
+          parents[pair] = (node, terminal)
+          queue.append(pair)
+
+    return None
 
   @staticmethod
   def fromFile(arquivo):
@@ -348,21 +1306,116 @@ class AF:
     """
 
     try:
-      file = open(arquivo).readlines()
-      file = [row.split() for row in file]
-
-      for row in file:
-        if '*vertices' in row:
-          n = int(row[1])
-        if '*initial' in row:
-          initial = int(row[1])
-        if '*final' in row:
-          final = [int(f) for f in row[1:]]
-
-      vertices = [*range(1, n + 1)]
-      transitions = [x for x in file[file.index(['*transitions']) + 1:] if x]
-      transitions = dict([((int(a), int(b)), x) for a, _, b, _, *x in transitions])
-    except:
+      with open(arquivo, 'rb') as f:
+        binary = f.read(len(AF.MAGIC)) == AF.MAGIC
+    except OSError:
       raise Exception('Arquivo inválido!')
-    
-    return AF(vertices, transitions, initial, final)
\ No newline at end of file
+
+    if binary:
+      return AF.fromBinary(arquivo)
+
+    with open(arquivo) as f:
+      return AF.fromLines(f)
+
+  @staticmethod
+  def fromLines(lines):
+    """
+    Lê, em uma única passagem, as linhas de um autômato no formato textual e retorna um autômato finito
+
+    As linhas são consumidas sob demanda, de forma que arquivos abertos não sejam carregados por inteiro na memória.
+    Os terminais são internalizados e os erros são reportados com o número da linha correspondente.
+
+    Parameters
+    ----------
+    lines: iterable
+      linhas do arquivo
+    """
+
+    def rows():
+      """Gera as linhas não vazias e que não são comentários, já separadas em tokens, com seus números"""
+
+      for number, row in enumerate(lines, 1):
+        row = row.split()
+        if row and not row[0].startswith('--'):
+          yield (number, row)
+
+    def error(number, message):
+      """
+      Retorna a exceção de arquivo inválido, indicando a linha do erro
+
+      Parameters
+      ----------
+      number: int
+        número da linha
+      message: str
+        descrição do erro
+      """
+
+      return Exception(f'Arquivo inválido! Linha {number}: {message}')
+
+    def states(number, row):
+      """
+      Converte uma lista de tokens em estados, verificando se pertencem ao autômato
+
+      Parameters
+      ----------
+      number: int
+        número da linha
+      row: list
+        tokens a serem convertidos
+      """
+
+      try:
+        aux = [int(x) for x in row]
+      except ValueError:
+        raise error(number, 'estado inválido')
+      if not all(1 <= x <= n for x in aux):
+        raise error(number, 'estado inexistente')
+      return aux
+
+    n = initial = final = None
+    terminals = dict()
+    transitions = dict()
+    section = None
+    number = 0
+
+    for number, row in rows():
+      if section == '*transitions':
+        if len(row) < 4 or row[1] != '>' or row[3] != '|':
+          raise error(number, 'transição mal formada, esperado "X > Y | a1 a2 ... an"')
+
+        (fonte, destino) = states(number, [row[0], row[2]])
+        if row[4:]:
+          aux = transitions.setdefault((fonte, destino), [])
+          for terminal in row[4:]:
+            terminal = terminals.setdefault(terminal, terminal)
+            if terminal not in aux:
+              aux.append(terminal)
+
+      elif row[0] == '*vertices':
+        if n is not None or len(row) != 2 or not row[1].isdigit() or int(row[1]) < 1:
+          raise error(number, 'número de estados inválido')
+        n = int(row[1])
+
+      elif row[0] in ['*initial', '*final', '*transitions'] and n is None:
+        raise error(number, '"*vertices" deve preceder as demais diretivas')
+
+      elif row[0] == '*initial':
+        if len(row) != 2:
+          raise error(number, 'deve haver exatamente um estado inicial')
+        [initial] = states(number, row[1:])
+
+      elif row[0] == '*final':
+        final = states(number, row[1:])
+
+      elif row[0] == '*transitions':
+        section = row[0]
+
+      elif row[0].startswith('*'):
+        raise error(number, f'diretiva desconhecida "{row[0]}"')
+
+    for (directive, value) in [('*vertices', n), ('*initial', initial), ('*final', final), ('*transitions', section)]:
+      if value is None:
+        raise error(number, f'diretiva "{directive}" não encontrada')
+
+    return AF(list(range(1, n + 1)), transitions, initial, final)
\ No newline at end of file
@@ -1,3 +1,5 @@
+import numpy as np
+from array import array
 from AF import AF
 
 class AFD(AF):
@@ -18,6 +20,12 @@ class AFD(AF):
     estado inicial
   final: list
     lista de estados de aceitação
+  table: array
+    tabela densa de transições, gerada por compile()
+  compiled: int
+    versão da estrutura compartilhada usada na compilação da tabela
+  rows: numpy.ndarray
+    tabela de transições em índices de linha, com uma coluna extra para símbolos desconhecidos, gerada por compile()
   """
 
   def __init__(self, AF):
@@ -28,26 +36,170 @@ class AFD(AF):
       instância de um autômato finito
     """
 
-    super().__init__(AF.vertices, AF.transitions, AF.initial, AF.final)
+    self.view(AF)
 
-    if super().isAFND():
+    if self.isAFND():
       raise Exception('O autômato é não-determinístico!')
 
-  def readInput(self, input):
+    self.table = None
+
+  def addTransition(self, fonte, destino, terminal):
     """
-    Verifica se o autômato reconhece determinada cadeia de entrada
+    Adiciona uma transição ao autômato e invalida a tabela compilada
 
     Parameters
     ----------
-    input: str
-      cadeia de caracteres de entrada
+    fonte: int
+      estado de origem
+    destino: int
+      estado de destino
+    terminal: str
+      símbolo terminal
     """
-    
-    cs = [self.initial]
-    for t in input:
-      cs = [x for vertice in cs for x in self.transit(vertice, t)]
 
-    return any([x in self.final for x in cs])
+    if terminal == '&' or any(x != destino for x in self.transit(fonte, terminal)):
+      raise Exception('O autômato é não-determinístico!')
+
+    super().addTransition(fonte, destino, terminal)
+    self.table = None
+
+  def compile(self):
+    """
+    Compila o autômato em uma tabela densa de transições
+
+    Os estados são numerados de 0 a N - 1, com um estado morto explícito de índice N, e os terminais de 0 a K - 1.
+    Cada célula da tabela guarda o deslocamento (índice * K) da linha do estado de destino, de forma que o
+    reconhecimento faça apenas uma consulta à tabela por símbolo de entrada.
+    """
+
+    if self.isAFND():
+      raise Exception('O autômato é não-determinístico!')
+
+    self.compiled = self.version
+    self.states = list(self.vertices)
+    ids = dict(zip(self.states, range(len(self.states))))
+    self.symbols = dict(zip(self.terminals, range(len(self.terminals))))
+
+    k = self.width = max(len(self.symbols), 1)
+    self.dead = len(self.states) * k
+    self.start = ids[self.initial] * k
+    self.table = array('q', [self.dead]) * (self.dead + k)
+    for fonte, edges in self.index.items():
+      for terminal, [destino] in edges.items():
+        self.table[ids[fonte] * k + self.symbols[terminal]] = ids[destino] * k
+
+    self.accepting = bytearray(len(self.states) + 1)
+    for vertice in self.final:
+      self.accepting[ids[vertice]] = 1
+
+    # Versão NumPy da tabela, em índices de linha, usada pelo reconhecimento em lote
+    n = len(self.states)
+    self.rows = np.full((n + 1, k + 1), n, dtype=np.int64)
+    self.rows[:, :k] = np.frombuffer(self.table, dtype=np.int64).reshape(n + 1, k) // k
+
+    return self
+
+  def startState(self):
+    """Retorna o estado inicial do reconhecimento, como deslocamento na tabela compilada"""
+
+    if self.table is None or self.compiled != self.version:
+      self.compile()
+
+    return self.start
+
+  def readChunk(self, cs, chunk):
+    """
+    Consome um bloco da cadeia de entrada, a partir de um estado, e retorna o estado alcançado
+
+    Parameters
+    ----------
+    cs: int
+      estado atual, como deslocamento na tabela compilada
+    chunk: str
+      bloco da cadeia de entrada
+    """
+
+    table, symbols, dead = self.table, self.symbols, self.dead
+
+    for t in chunk:
+      c = symbols.get(t)
+      if c is None:
+        return dead
+      cs = table[cs + c]
+      if cs == dead:
+        return dead
+
+    return cs
+
+  def isAccepting(self, cs):
+    """
+    Verifica se um estado, como deslocamento na tabela compilada, é de aceitação
+
+    Parameters
+    ----------
+    cs: int
+      estado atual
+    """
+
+    return cs != self.dead and bool(self.accepting[cs // self.width])
+
+  def isDead(self, cs):
+    """
+    Verifica se um estado, como deslocamento na tabela compilada, é o estado morto
+
+    Parameters
+    ----------
+    cs: int
+      estado atual
+    """
+
+    return cs == self.dead
+
+  def readMany(self, inputs):
+    """
+    Verifica, em lote, se o autômato reconhece cada uma das cadeias de entrada, retornando um vetor de booleanos
+
+    As cadeias são concatenadas e convertidas, de uma só vez, em um vetor de códigos de terminais. Ordenadas da maior
+    para a menor, todas avançam juntas sobre a tabela NumPy, com uma única indexação vetorizada por posição,
+    aplicada apenas ao prefixo de cadeias que ainda não terminaram. Quando restam poucas cadeias ativas, elas são
+    concluídas individualmente, para que uma cadeia muito longa não pague o custo de uma operação vetorial por símbolo.
+
+    Parameters
+    ----------
+    inputs: iterable
+      cadeias de caracteres de entrada
+    """
+
+    start = self.startState()
+    rows = self.rows
+    accepting = np.frombuffer(bytes(self.accepting), dtype=np.uint8).astype(bool)
+
+    inputs = list(inputs)
+    if not inputs:
+      return np.zeros(0, dtype=bool)
+
+    (codes, lengths, offsets, order) = AF.encode(inputs, self.symbols)
+
+    cs = np.full(len(inputs), start // self.width, dtype=np.int64)
+    active = len(inputs)
+    c = 0
+    while c < lengths[0]:
+      while lengths[active - 1] <= c:
+        active -= 1
+      if active < 32:
+        break
+      cs[:active] = rows[cs[:active], codes[offsets[:active] + c]]
+      c += 1
+
+    # As últimas cadeias ativas são concluídas na tabela compilada, a partir do estado já alcançado
+    for j in range(active):
+      if lengths[j] > c:
+        cs[j] = self.readChunk(int(cs[j]) * self.width, inputs[order[j]][c:]) // self.width
+
+    result = np.zeros(len(inputs), dtype=bool)
+    result[order] = accepting[cs]
+
+    return result
 
   @staticmethod
   def union(AF1, AF2):
@@ -81,7 +233,9 @@ class AFD(AF):
 
     from AFND import AFND
 
-    return AFND.intersection(AF1, AF2).toAFD()
+    af = AF.intersection(AF1, AF2)
+
+    return AFND(af).toAFD() if af.isAFND() else AFD(af)
 
   @staticmethod
   def fromFile(arquivo):
@@ -1,5 +1,7 @@
-import itertools
+import numpy as np
+from collections import deque
 from AF import AF
+from LazyAFD import LazyAFD
 
 class AFND(AF):
   """
@@ -19,6 +21,10 @@ class AFND(AF):
     estado inicial
   final: list
     lista de estados de aceitação
+  successors: dict
+    máscaras de sucessores por terminal, geradas por compile()
+  compiled: int
+    versão da estrutura compartilhada usada na compilação das máscaras
   """
 
   def __init__(self, AF):
@@ -29,11 +35,30 @@ class AFND(AF):
       instância de um autômato finito
     """
 
-    super().__init__(AF.vertices, AF.transitions, AF.initial, AF.final)
+    self.view(AF)
 
-    if not super().isAFND():
+    if not self.isAFND():
       raise Exception('O autômato é determinístico!')
 
+    self.successors = None
+
+  def addTransition(self, fonte, destino, terminal):
+    """
+    Adiciona uma transição ao autômato e invalida as máscaras compiladas
+
+    Parameters
+    ----------
+    fonte: int
+      estado de origem
+    destino: int
+      estado de destino
+    terminal: str
+      símbolo terminal
+    """
+
+    super().addTransition(fonte, destino, terminal)
+    self.successors = None
+
   def calcFecho(self, vertice):
     """
     Calcula o ε-fecho de determinado estado
@@ -44,54 +69,268 @@ class AFND(AF):
       estado
     """
 
-    return [vertice] + list(itertools.chain(*[self.calcFecho(x) for x in self.transit(vertice, '&') if x != vertice]))
+    return [vertice] + sorted(x for x in self.closures()[vertice] if x != vertice)
+
+  def compile(self):
+    """
+    Compila o autômato para a simulação por conjuntos de bits
 
-  def readInput(self, input):
+    Apenas os estados alcançáveis e não mortos são considerados. Eles são numerados de 0 a N - 1 e cada conjunto
+    de estados é representado por um inteiro, onde o bit i indica a presença do i-ésimo estado. Para cada terminal
+    e estado é pré-calculada a máscara dos estados alcançados, já incluindo o ε-fecho dos destinos. Estados de um
+    mesmo componente de ε-transições compartilham o fecho e, portanto, uma única máscara.
     """
-    Verifica se o autômato reconhece determinada cadeia de entrada
+
+    self.compiled = self.version
+    useful = self.accessible() & self.coaccessible()
+    self.states = [vertice for vertice in self.vertices if vertice in useful]
+    ids = dict(zip(self.states, range(len(self.states))))
+
+    fecho = self.closures()
+    shared = dict()
+    for vertice in self.states:
+      if fecho[vertice] not in shared:
+        shared[fecho[vertice]] = AFND.mask(ids[x] for x in fecho[vertice] if x in ids)
+    self.closureMasks = [shared[fecho[vertice]] for vertice in self.states]
+    self.successors = dict()
+    for terminal in self.terminals:
+      if terminal != '&':
+        masks = [0] * len(self.states)
+        for vertice, i in ids.items():
+          for x in self.transit(vertice, terminal):
+            if x in ids:
+              masks[i] |= self.closureMasks[ids[x]]
+        self.successors[terminal] = masks
+
+    self.start = self.closureMasks[ids[self.initial]] if self.initial in ids else 0
+    self.finalMask = AFND.mask(ids[x] for x in self.final if x in ids)
+
+    return self
+
+  @staticmethod
+  def mask(indices):
+    """
+    Retorna a máscara de bits de um conjunto de índices, marcando os bits em um vetor de bytes
 
     Parameters
     ----------
-    input: str
-      cadeia de caracteres de entrada
+    indices: iterable
+      índices dos bits marcados
     """
 
-    fecho = dict(zip(self.vertices, [self.calcFecho(vertice) for vertice in self.vertices]))
-    
-    cs = fecho[self.initial]
-    for t in input:
-      cs = [y for vertice in cs for x in self.transit(vertice, t) for y in fecho[x]]
+    aux = bytearray()
+    for i in indices:
+      if len(aux) <= i >> 3:
+        aux.extend(bytes((i >> 3) + 1 - len(aux)))
+      aux[i >> 3] |= 1 << (i & 7)
+
+    return int.from_bytes(aux, 'little')
+
+  def startState(self):
+    """Retorna o estado inicial do reconhecimento, como a máscara do ε-fecho do estado inicial"""
+
+    if self.successors is None or self.compiled != self.version:
+      self.compile()
+
+    return self.start
+
+  def readChunk(self, cs, chunk):
+    """
+    Consome um bloco da cadeia de entrada, a partir de um conjunto de estados, e retorna o conjunto alcançado
+
+    Parameters
+    ----------
+    cs: int
+      máscara do conjunto de estados atual
+    chunk: str
+      bloco da cadeia de entrada
+    """
+
+    for t in chunk:
+      cs = self.step(cs, t)
+      if not cs:
+        break
+
+    return cs
+
+  def step(self, cs, terminal):
+    """
+    Retorna o conjunto de estados alcançado a partir de um conjunto de estados e um único terminal
+
+    Parameters
+    ----------
+    cs: int
+      máscara do conjunto de estados atual
+    terminal: str
+      símbolo terminal
+    """
+
+    masks = self.successors.get(terminal)
+    if masks is None:
+      return 0
+
+    ns = 0
+    while cs:
+      low = cs & -cs
+      ns |= masks[low.bit_length() - 1]
+      cs ^= low
+
+    return ns
+
+  def isAccepting(self, cs):
+    """
+    Verifica se um conjunto de estados contém algum estado de aceitação
+
+    Parameters
+    ----------
+    cs: int
+      máscara do conjunto de estados atual
+    """
+
+    return bool(cs & self.finalMask)
 
-    return any([x in self.final for x in cs])
+  def isDead(self, cs):
+    """
+    Verifica se um conjunto de estados está vazio
+
+    Parameters
+    ----------
+    cs: int
+      máscara do conjunto de estados atual
+    """
+
+    return not cs
+
+  def lazy(self, limit=10000):
+    """
+    Retorna um autômato finito determinístico construído sob demanda, equivalente ao autômato
+
+    Parameters
+    ----------
+    limit [default=10000]: int
+      número máximo de estados determinísticos armazenados na cache
+    """
+
+    return LazyAFD(self, limit)
+
+  def readMany(self, inputs):
+    """
+    Verifica, em lote, se o autômato reconhece cada uma das cadeias de entrada, retornando um vetor de booleanos
+
+    As cadeias são codificadas de uma só vez e, ordenadas da maior para a menor, avançam juntas sobre uma tabela
+    NumPy, com uma única indexação vetorizada por posição. A tabela é determinizada sob demanda: os conjuntos de
+    estados alcançados são numerados à medida que aparecem e apenas as células ainda não calculadas, uma vez por par
+    (conjunto, terminal) distinto, passam pela simulação por conjuntos de bits. Quando restam poucas cadeias ativas,
+    elas são concluídas individualmente.
+
+    Parameters
+    ----------
+    inputs: iterable
+      cadeias de caracteres de entrada
+    """
+
+    start = self.startState()
+
+    inputs = list(inputs)
+    if not inputs:
+      return np.zeros(0, dtype=bool)
+
+    terminals = [t for t in self.terminals if t != '&']
+    k = len(terminals)
+    (codes, lengths, offsets, order) = AF.encode(inputs, dict(zip(terminals, range(k))))
+
+    # Conjuntos numerados sob demanda; o conjunto vazio tem índice 0 e as células ainda não calculadas valem -1
+    sets = [0, start]
+    ids = {0: 0, start: 1}
+    rows = AFND.rows(64, k)
+    rows[0, :] = 0
+
+    cs = np.full(len(inputs), ids[start], dtype=np.int64)
+    active = len(inputs)
+    c = 0
+    while c < lengths[0]:
+      while lengths[active - 1] <= c:
+        active -= 1
+      if active < 32:
+        break
+
+      column = codes[offsets[:active] + c]
+      ns = rows[cs[:active], column]
+      missing = ns < 0
+      if missing.any():
+        for key in np.unique(cs[:active][missing] * (k + 1) + column[missing]).tolist():
+          (i, t) = divmod(key, k + 1)
+          aux = self.step(sets[i], terminals[t])
+          if aux not in ids:
+            ids[aux] = len(sets)
+            sets.append(aux)
+            if len(sets) > len(rows):
+              rows = np.concatenate((rows, AFND.rows(len(rows), k)))
+          rows[i, t] = ids[aux]
+        ns = rows[cs[:active], column]
+      cs[:active] = ns
+      c += 1
+
+    result = np.zeros(len(inputs), dtype=bool)
+    result[order] = np.array([self.isAccepting(x) for x in sets])[cs]
+
+    # As últimas cadeias ativas são concluídas pela simulação, a partir do conjunto já alcançado
+    for j in range(active):
+      if lengths[j] > c:
+        result[order[j]] = self.isAccepting(self.readChunk(sets[cs[j]], inputs[order[j]][c:]))
+
+    return result
+
+  @staticmethod
+  def rows(n, k):
+    """
+    Retorna um bloco de linhas ainda não calculadas da tabela do reconhecimento em lote
+
+    Parameters
+    ----------
+    n: int
+      número de linhas
+    k: int
+      número de terminais; a última coluna, de símbolos desconhecidos, leva ao conjunto vazio
+    """
+
+    aux = np.full((n, k + 1), -1, dtype=np.int64)
+    aux[:, k] = 0
+
+    return aux
 
   def toAFD(self):
     """
     Converte o autômato finito não-determinístico para um autômato finito determinístico
+
+    Os subconjuntos de estados são representados pelas máscaras de bits da simulação e indexados em um dicionário,
+    de forma que cada subconjunto novo seja identificado em tempo constante.
     """
 
     from AFD import AFD
 
-    fecho = dict(zip(self.vertices, [self.calcFecho(vertice) for vertice in self.vertices]))
+    start = self.startState()
+    terminals = [t for t in self.terminals if t != '&']
 
-    new_vertices = {str(fecho[self.initial]): 1}
+    new_vertices = {start: 1}
     new_transitions = dict()
-    new_final = []
-    count = 1
-
-    current_states = [fecho[self.initial]]
-    for vertices in current_states:
-      for terminal in [t for t in self.terminals if t != '&']:
-        aux = sorted(set([y for vertice in vertices for x in self.transit(vertice, terminal) for y in fecho[x]]))
-        if aux not in current_states:
-          count += 1
-          new_vertices[str(aux)] = count
-          
-          if any([x in self.final for x in aux]):
-            new_final.append(new_vertices[str(aux)])
-          
+    new_final = [1] if self.isAccepting(start) else []
+
+    current_states = deque([start])
+    while current_states:
+      vertices = current_states.popleft()
+      fonte = new_vertices[vertices]
+      for terminal in terminals:
+        aux = self.step(vertices, terminal)
+        if aux not in new_vertices:
+          new_vertices[aux] = len(new_vertices) + 1
+
+          if self.isAccepting(aux):
+            new_final.append(new_vertices[aux])
+
           current_states.append(aux)
 
-        new_transitions[new_vertices[str(vertices)], new_vertices[str(aux)]] = new_transitions.get((new_vertices[str(vertices)], new_vertices[str(aux)]), []) + [terminal]
+        new_transitions.setdefault((fonte, new_vertices[aux]), []).append(terminal)
 
     return AFD(AF(list(new_vertices.values()), new_transitions, 1, new_final))
 
@@ -114,6 +353,8 @@ class AFND(AF):
   def intersection(AF1, AF2):
     """
     Faz a intersecção, por meio do produto cartesiano, de dois autômatos finitos, em um autômato finito não-determinístico
+
+    Como o produto elimina as ε-transições, o resultado pode ser determinístico; nesse caso, é retornado um AFD.
     
     Parameters
     ----------
@@ -123,7 +364,11 @@ class AFND(AF):
       instância de um autômato finito
     """
 
-    return AFND(AF.intersection(AF1, AF2))
+    from AFD import AFD
+
+    af = AF.intersection(AF1, AF2)
+
+    return AFND(af) if af.isAFND() else AFD(af)
 
   @staticmethod
   def fromFile(arquivo):
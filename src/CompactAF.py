@@ -0,0 +1,345 @@
+from array import array
+from bisect import bisect_left
+from AF import AF
+
+class CompactAF(AF):
+  """
+  Uma classe usada para representar autômatos finitos de forma compacta, baseada em vetores
+
+  Os estados e terminais são codificados como inteiros e as transições ficam em formato CSR: as transições do
+  estado i ocupam as posições offsets[i] a offsets[i + 1] - 1 dos vetores symbols e targets, ordenadas por terminal.
+  Os vetores podem ser arrays ou memoryviews sobre um arquivo mapeado em memória.
+
+  Extends
+  ----------
+  classe AF
+
+  Attributes
+  ----------
+  labels: array
+    rótulos dos estados, indexados por seus códigos
+  terminals: list
+    lista ordenada de terminais, indexados por seus códigos
+  offsets: array
+    início das transições de cada estado
+  symbols: array
+    códigos dos terminais de cada transição
+  targets: array
+    códigos dos estados de destino de cada transição
+  initial: int
+    estado inicial
+  final: list
+    lista de estados de aceitação
+  vertexCache: list
+    lista de estados, materializada no primeiro acesso a vertices
+  transitionCache: dict
+    dicionário de transições, materializado no primeiro acesso a transitions
+  """
+
+  __slots__ = ('labels', 'ids', 'codes', 'offsets', 'symbols', 'targets', 'reverseOffsets', 'reverseSymbols', 'reverseSources', 'vertexCache', 'transitionCache')
+
+  def __init__(self, labels, terminals, offsets, symbols, targets, initial, final):
+    """
+    Parameters
+    ----------
+    labels: array
+      rótulos dos estados, indexados por seus códigos
+    terminals: list
+      lista ordenada de terminais, indexados por seus códigos
+    offsets: array
+      início das transições de cada estado
+    symbols: array
+      códigos dos terminais de cada transição
+    targets: array
+      códigos dos estados de destino de cada transição
+    initial: int
+      código do estado inicial
+    final: list
+      códigos dos estados de aceitação
+    """
+
+    n = len(labels)
+    if len(offsets) != n + 1 or offsets[0] != 0 or len(symbols) != offsets[n] or len(targets) != offsets[n]:
+      raise Exception('Vetores de transições inconsistentes!')
+    if any(offsets[i] > offsets[i + 1] for i in range(n)):
+      raise Exception('Vetores de transições inconsistentes!')
+    if any(x >= n for x in targets) or any(x >= len(terminals) for x in symbols):
+      raise Exception('Transições entre estados inexistentes não são permitidas!')
+    if any(symbols[j] > symbols[j + 1] for i in range(n) for j in range(offsets[i], offsets[i + 1] - 1)):
+      raise Exception('As transições de cada estado devem estar ordenadas por terminal!')
+    if not 0 <= initial < n:
+      raise Exception('Estado inicial não encontrado!')
+    if not all(0 <= x < n for x in final):
+      raise Exception('Estado(s) de aceitação não encontrado(s)!')
+
+    self.structure = {'version': 1}
+    self.labels = labels
+    self.ids = None if all(labels[i] == i + 1 for i in range(n)) else dict(zip(labels, range(n)))
+    self.terminals = list(terminals)
+    self.codes = dict(zip(self.terminals, range(len(self.terminals))))
+    self.offsets = offsets
+    self.symbols = symbols
+    self.targets = targets
+    self.initial = labels[initial]
+    self.final = [labels[x] for x in final]
+    self.reverseOffsets = self.reverseSymbols = self.reverseSources = None
+    self.vertexCache = self.transitionCache = None
+    self.fecho = None
+    self.completeness = None
+    self.searcherCache = None
+    self.nondeterministic = '&' in self.codes or any(symbols[j] == symbols[j + 1] for i in range(n) for j in range(offsets[i], offsets[i + 1] - 1))
+
+  @property
+  def vertices(self):
+    """Lista com os estados do autômato, materializada a partir dos vetores no primeiro acesso"""
+
+    if self.vertexCache is None:
+      self.vertexCache = list(self.labels)
+
+    return self.vertexCache
+
+  @property
+  def transitions(self):
+    """Dicionário de transições do autômato, materializado a partir dos vetores no primeiro acesso"""
+
+    if self.transitionCache is None:
+      transitions = dict()
+      for i in range(len(self.labels)):
+        for j in range(self.offsets[i], self.offsets[i + 1]):
+          transitions.setdefault((self.labels[i], self.labels[self.targets[j]]), []).append(self.terminals[self.symbols[j]])
+      self.transitionCache = transitions
+
+    return self.transitionCache
+
+  def code(self, vertice):
+    """
+    Retorna o código de um estado, ou None caso o estado não exista
+
+    Parameters
+    ----------
+    vertice: int
+      estado
+    """
+
+    if self.ids is not None:
+      return self.ids.get(vertice)
+    return vertice - 1 if isinstance(vertice, int) and 1 <= vertice <= len(self.labels) else None
+
+  def buildIndex(self):
+    """Os vetores já funcionam como índice, de forma que não há o que construir"""
+
+  def addTransition(self, fonte, destino, terminal):
+    """
+    A representação compacta é imutável; converta-a com toAF() para alterá-la
+
+    Parameters
+    ----------
+    fonte: int
+      estado de origem
+    destino: int
+      estado de destino
+    terminal: str
+      símbolo terminal
+    """
+
+    raise Exception('A representação compacta não permite alterações!')
+
+  def transit(self, vertice, terminal):
+    """
+    Retorna os possíveis próximos estados, a partir de um terminal
+
+    Parameters
+    ----------
+    vertice: int
+      estado atual
+    terminal: str
+      símbolo terminal
+    """
+
+    i = self.code(vertice)
+    c = self.codes.get(terminal)
+    if i is None or c is None:
+      return []
+
+    (j, end) = (self.offsets[i], self.offsets[i + 1])
+    j = bisect_left(self.symbols, c, j, end)
+
+    aux = []
+    while j < end and self.symbols[j] == c:
+      aux.append(self.labels[self.targets[j]])
+      j += 1
+
+    return aux
+
+  def edges(self, vertice):
+    """
+    Retorna as transições que partem de um estado, como pares (terminal, destinos)
+
+    Parameters
+    ----------
+    vertice: int
+      estado atual
+    """
+
+    i = self.code(vertice)
+    if i is None:
+      return []
+
+    return CompactAF.group(self.offsets[i], self.offsets[i + 1], self.symbols, self.targets, self.labels, self.terminals)
+
+  def buildReverse(self):
+    """
+    Constrói os vetores CSR das transições reversas, por duas ordenações por contagem estáveis
+
+    As transições são primeiro distribuídas por terminal e, nessa ordem, por estado de destino, de forma que cada
+    linha reversa fique ordenada por terminal, em tempo linear no número de estados, terminais e transições.
+    """
+
+    (n, m, k) = (len(self.labels), len(self.targets), len(self.terminals))
+
+    # Ordem das transições por terminal, guardando também a origem de cada uma
+    count = array('I', [0]) * (k + 1)
+    for c in self.symbols:
+      count[c + 1] += 1
+    for c in range(k):
+      count[c + 1] += count[c]
+
+    order = array('I', [0]) * m
+    origins = array('I', [0]) * m
+    for i in range(n):
+      for j in range(self.offsets[i], self.offsets[i + 1]):
+        c = self.symbols[j]
+        order[count[c]] = j
+        origins[count[c]] = i
+        count[c] += 1
+
+    # Distribuição estável, por estado de destino, das transições já ordenadas por terminal
+    offsets = array('I', [0]) * (n + 1)
+    for x in self.targets:
+      offsets[x + 1] += 1
+    for i in range(n):
+      offsets[i + 1] += offsets[i]
+
+    position = array('I', offsets)
+    sources = array('I', [0]) * m
+    symbols = array('I', [0]) * m
+    for j, i in zip(order, origins):
+      x = self.targets[j]
+      sources[position[x]] = i
+      symbols[position[x]] = self.symbols[j]
+      position[x] += 1
+
+    (self.reverseOffsets, self.reverseSymbols, self.reverseSources) = (offsets, symbols, sources)
+
+  def reverseEdges(self, vertice):
+    """
+    Retorna as transições que chegam a um estado, como pares (terminal, origens)
+
+    Parameters
+    ----------
+    vertice: int
+      estado atual
+    """
+
+    i = self.code(vertice)
+    if i is None:
+      return []
+    if self.reverseOffsets is None:
+      self.buildReverse()
+
+    return CompactAF.group(self.reverseOffsets[i], self.reverseOffsets[i + 1], self.reverseSymbols, self.reverseSources, self.labels, self.terminals)
+
+  def previous(self, vertice, terminal):
+    """
+    Retorna os possíveis estados anteriores, a partir de um terminal
+
+    Parameters
+    ----------
+    vertice: int
+      estado atual
+    terminal: str
+      símbolo terminal
+    """
+
+    return dict(self.reverseEdges(vertice)).get(terminal, [])
+
+  def toAF(self):
+    """Converte o autômato para a representação baseada em dicionários"""
+
+    return AF(list(self.vertices), dict((key, list(value)) for key, value in self.transitions.items()), self.initial, list(self.final))
+
+  def toCompact(self):
+    """Retorna o próprio autômato, que já está na representação compacta"""
+
+    return self
+
+  @staticmethod
+  def group(start, end, symbols, targets, labels, terminals):
+    """
+    Agrupa, por terminal, um trecho ordenado de vetores CSR
+
+    Parameters
+    ----------
+    start: int
+      posição inicial do trecho
+    end: int
+      posição final (exclusiva) do trecho
+    symbols: array
+      códigos dos terminais
+    targets: array
+      códigos dos estados
+    labels: array
+      rótulos dos estados
+    terminals: list
+      lista de terminais
+    """
+
+    aux = []
+    for j in range(start, end):
+      if not aux or aux[-1][0] != terminals[symbols[j]]:
+        aux.append((terminals[symbols[j]], []))
+      aux[-1][1].append(labels[targets[j]])
+
+    return aux
+
+  @staticmethod
+  def fromAF(af):
+    """
+    Converte um autômato finito para a representação compacta
+
+    Parameters
+    ----------
+    af: AF object
+      instância de um autômato finito
+    """
+
+    states = list(af.vertices)
+    ids = dict(zip(states, range(len(states))))
+    codes = dict(zip(af.terminals, range(len(af.terminals))))
+
+    offsets = array('I', [0])
+    symbols = array('I')
+    targets = array('I')
+    for vertice in states:
+      for terminal, edges in sorted(af.edges(vertice)):
+        for x in edges:
+          symbols.append(codes[terminal])
+          targets.append(ids[x])
+      offsets.append(len(targets))
+
+    return CompactAF(array('q', states), af.terminals, offsets, symbols, targets, ids[af.initial], sorted(set(ids[x] for x in af.final)))
+
+  @staticmethod
+  def fromBinary(arquivo):
+    """
+    Mapeia em memória um arquivo no formato binário e retorna um autômato compacto que usa seus vetores sem cópia
+
+    Parameters
+    ----------
+    arquivo: str
+      caminho do arquivo
+    """
+
+    data = AF.readBinary(arquivo)
+
+    return CompactAF(data['labels'], data['terminals'], data['offsets'], data['symbols'], data['targets'], data['initial'], data['final'])
@@ -1,4 +1,8 @@
+from collections import deque
 from AF import AF
+from AFD import AFD
+from AFND import AFND
+from Node import Node
 from Tree import Tree
 
 class ER:
@@ -23,11 +27,11 @@ class ER:
       árvore de derivação
     """
 
-    expression = expression.replace(' ', '').replace('|', '+') + '#'
+    expression = ER.units(expression) + ['#']
 
-    self.expression = ''
+    aux = []
     for c in range(len(expression) - 1):
-      self.expression += expression[c]
+      aux.append(expression[c])
 
       if (expression[c] in ['+', '.'] and expression[c + 1] in ['+', '.', '*'] or 
           expression[c] == '*' and expression[c + 1] == '*' or 
@@ -35,84 +39,250 @@ class ER:
         raise Exception('Expressão inválida!')
 
       if expression[c] not in ['+', '.', '('] and expression[c + 1] not in ['*', '.', '+', ')']:
-        self.expression += '.'
-    self.expression += '#'
+        aux.append('.')
+    aux.append('#')
+    self.expression = ''.join(aux)
 
     self.tree = self.generateERTree()
 
+  @staticmethod
+  def units(expression):
+    """
+    Separa uma expressão regular em unidades: operadores, caracteres e caracteres escapados com \\
+
+    Espaços são eliminados e | é convertido em +, exceto quando escapados. Um caractere escapado (\\+, \\(, \\ ,
+    \\\\, ...) é sempre lido como terminal; # e & não podem ser escapados, pois não são terminais de autômatos.
+
+    Parameters
+    ----------
+    expression: str
+      expressão regular
+    """
+
+    aux = []
+    i = 0
+    while i < len(expression):
+      c = expression[i]
+      if c == '\\':
+        if i + 1 == len(expression) or expression[i + 1] in ['#', '&']:
+          raise Exception('Expressão inválida!')
+        aux.append(expression[i:i + 2])
+        i += 2
+        continue
+
+      if c != ' ':
+        aux.append('+' if c == '|' else c)
+      i += 1
+
+    return aux
+
+  @staticmethod
+  def escape(text):
+    """
+    Retorna uma expressão regular que reconhece apenas o texto informado, escapando os caracteres reservados
+
+    Parameters
+    ----------
+    text: str
+      texto literal
+    """
+
+    return ''.join('\\' + c if c in '+.*()| \\' else c for c in text)
+
   def generateERTree(self):
-    """Gera e retorna a árvore de derivação da expressão regular"""
-    
-    def private(start, end):
+    """
+    Gera e retorna a árvore de derivação da expressão regular
+
+    A expressão é lida uma única vez, da esquerda para a direita, com duas pilhas (shunting-yard): uma de operandos
+    e outra de operadores. Os operadores binários + e . têm a mesma precedência e são associativos à esquerda, e o
+    operador * é aplicado diretamente ao último operando.
+    """
+
+    def reduce(operands, operators):
       """
-      Insere, na árvore de derivação, um trecho da expressão regular, caractere por caractere
-      
+      Aplica o operador binário do topo da pilha aos dois últimos operandos
+
       Parameters
       ----------
-      start: int
-        índice inicial da subexpressão
-      end: int
-        índice final da subexpressão
+      operands: list
+        pilha de operandos
+      operators: list
+        pilha de operadores
       """
 
-      tree = Tree()
-      index = end
-      while index >= start:
-        if any(index == x for _, x in indexes if x != end):
-          [(x, y)] = [(start, end) for start, end in indexes if end == index]
-          tree.insert(private(x, y))
-          index = x
-          pass
-        elif self.expression[index] not in ['(', ')']:
-          tree.insert(self.expression[index])
-        index -= 1
+      r_child = operands.pop()
+      l_child = operands.pop()
+      node = Node(operators.pop(), l_child=l_child, r_child=r_child)
+      l_child.parent = r_child.parent = node
+      operands.append(node)
 
-      return tree
+    operands = []
+    operators = []
+    operand = True
+    for c in ER.units(self.expression):
+      if len(c) == 2:
+        if not operand:
+          raise Exception('Expressão inválida!')
+        operands.append(Node(c[1]))
+        operand = False
+      elif c == '(':
+        if not operand:
+          raise Exception('Expressão inválida!')
+        operators.append(c)
+      elif c == ')':
+        if operand:
+          raise Exception('Expressão inválida!')
+        while operators and operators[-1] != '(':
+          reduce(operands, operators)
+        if not operators:
+          raise Exception('Expressão inválida!')
+        operators.pop()
+      elif c == '*':
+        if operand:
+          raise Exception('Expressão inválida!')
+        node = Node(c, m_child=operands[-1])
+        operands[-1].parent = node
+        operands[-1] = node
+      elif c in ['+', '.']:
+        if operand:
+          raise Exception('Expressão inválida!')
+        while operators and operators[-1] != '(':
+          reduce(operands, operators)
+        operators.append(c)
+        operand = True
+      else:
+        if not operand:
+          raise Exception('Expressão inválida!')
+        operands.append(Node(c))
+        operand = False
 
-    aux = []
-    indexes = []
-    try:
-      for index in range(len(self.expression)):
-        if self.expression[index] == '(':
-          aux.append(index)
-        if self.expression[index] == ')':
-          indexes.append((aux.pop(), index + 1 if self.expression[index + 1] == '*' else index))
-        if self.expression[index] == '*' and self.expression[index - 1] != ')':
-          indexes.append((index - 1, index))
-
-      if len(aux) > 0:
-        raise Exception()
-    except:
+    while operators and operators[-1] != '(':
+      reduce(operands, operators)
+    if operators or operand:
       raise Exception('Expressão inválida!')
 
-    return private(0, len(self.expression) - 1)
+    tree = Tree()
+    tree.root = tree.last = operands.pop()
+
+    return tree
 
   def toAF(self):
     """Converte a expressão regular para um autômato finito"""
 
+    return ER.treeToAF(self.tree)[0]
+
+  def toAFD(self, minimize=False):
+    """
+    Converte a expressão regular para um autômato finito determinístico
+
+    Parameters
+    ----------
+    minimize [default=False]: bool
+      indica se o autômato deve ser minimizado
+    """
+
+    af = self.toAF()
+
+    return AFD(AF.minimize(af) if minimize else af)
+
+  def toAFND(self):
+    """
+    Converte a expressão regular para um autômato finito de posições (Glushkov), com tamanho linear
+
+    Cada posição da árvore de derivação é um estado, alcançado pelo seu próprio terminal, e o estado 1 é o estado
+    inicial; as posições são numeradas de 2 a N + 1, na ordem da árvore. O autômato pode ser não-determinístico,
+    mas nunca tem mais estados do que a expressão tem símbolos, mais um.
+    """
+
     follow_pos = self.tree.followPos()
-    
-    dstates = [sorted([x.index for x in self.tree.root.firstPos()])]
-    visited = []
-    dtran = dict()
-    while dstates:
-      visited.append(dstates.pop())
-      for terminal in set([self.tree.dict[x] for x in visited[-1] if self.tree.dict[x] != '#']):
-        union = []
-        union += [y for x in visited[-1] for y in follow_pos[x] if self.tree.dict[x] == terminal]
-        union = sorted(list(set(union)))
-
-        if union not in visited and union not in dstates:
-          dstates.append(union)
-
-        dtran[str(visited[-1]), str(union)] = dtran.get((str(visited[-1]), str(union)), []) + [terminal]
-
-    new_states = dict()
-    for i in range(1, len(visited) + 1):
-      new_states[str(visited[i - 1])] = i
-    
+    end = sum(1 << x for x, terminal in self.tree.dict.items() if terminal == '#')
+    positions = [x for x, terminal in self.tree.dict.items() if terminal not in ['#', '&']]
+    ids = dict(zip(positions, range(2, len(positions) + 2)))
+
+    new_transitions = dict()
+    new_final = []
+    for fonte, aux in [(1, self.tree.root.firstPos())] + [(ids[x], follow_pos[x]) for x in positions]:
+      for destino in Tree.indices(aux & ~end):
+        new_transitions[(fonte, ids[destino])] = [self.tree.dict[destino]]
+      if aux & end:
+        new_final.append(fonte)
+
+    return AF(list(range(1, len(positions) + 2)), new_transitions, 1, new_final)
+
+  def recognizer(self, limit=10000):
+    """
+    Retorna um reconhecedor para a expressão regular, escolhendo automaticamente entre AFD e simulação do AFND
+
+    O AFD é construído enquanto tiver até limit estados. Expressões maiores, cujo AFD poderia não caber em memória,
+    são reconhecidas pelo autômato de posições, simulado por um AFD construído sob demanda com cache limitada.
+
+    Parameters
+    ----------
+    limit [default=10000]: int
+      número máximo de estados do AFD e da cache da simulação
+    """
+
+    result = ER.treeToAF(self.tree, limit)
+    if result:
+      return AFD(result[0]).compile()
+
+    af = self.toAFND()
+
+    return AFND(af).lazy(limit) if af.isAFND() else AFD(af).compile()
+
+  @staticmethod
+  def treeToAF(tree, limit=None):
+    """
+    Converte uma árvore de derivação, por meio da função FollowPos, para um autômato finito
+
+    Cada estado é um conjunto de posições representado por uma máscara de bits e indexado em um dicionário. As
+    posições de cada terminal são agrupadas em uma máscara antes da construção, de forma que as posições de um
+    estado que leem determinado terminal sejam obtidas com uma única operação.
+
+    Retorna uma tupla com o autômato e um dicionário com as posições da árvore que compõem cada estado, ou None,
+    caso o autômato ultrapasse o limite de estados.
+
+    Parameters
+    ----------
+    tree: Tree object
+      árvore de derivação
+    limit [default=None]: int
+      número máximo de estados do autômato, ou None para não limitar
+    """
+
+    follow_pos = tree.followPos()
+
+    groups = dict()
+    for x, terminal in tree.dict.items():
+      groups[terminal] = groups.get(terminal, 0) | 1 << x
+    end = groups.pop('#', 0)
+    groups.pop('&', None)
+    groups = sorted(groups.items())
+
+    start = tree.root.firstPos()
+    new_states = {start: 1}
     new_transitions = dict()
-    for ((fonte, destino), terminal) in dtran.items():
-      new_transitions[(new_states[str(fonte)], new_states[str(destino)])] = terminal
-    
-    return AF(list(new_states.values()), new_transitions, 1, [new_states[str(x)] for x in visited if any(self.tree.dict[y] == '#' for y in x)])
\ No newline at end of file
+    current_states = deque([start])
+    while current_states:
+      positions = current_states.popleft()
+      fonte = new_states[positions]
+      for terminal, mask in groups:
+        aux = positions & mask
+        if not aux:
+          continue
+
+        union = 0
+        for x in Tree.indices(aux):
+          union |= follow_pos[x]
+
+        if union not in new_states:
+          if limit is not None and len(new_states) >= limit:
+            return None
+          new_states[union] = len(new_states) + 1
+          current_states.append(union)
+
+        new_transitions.setdefault((fonte, new_states[union]), []).append(terminal)
+
+    af = AF(list(new_states.values()), new_transitions, 1, [i for positions, i in new_states.items() if positions & end])
+
+    return (af, dict((i, Tree.indices(positions)) for positions, i in new_states.items()))
@@ -187,26 +187,25 @@ class Grammar:
     
     Parameters
     ----------
-    input: str
-      valor da entrada
+    input: str or iterable
+      valor da entrada, separado por espaços, ou sequência de tokens (como a gerada por Lexer.tokens)
     """
 
-    input = input.split()
-    input += ['$']
+    input = chain(input.split() if isinstance(input, str) else input, ['$'])
 
     grammar = self
     if not self.llTable:
       grammar = self.buildLLTable()
 
     stack = ['$', grammar.nterminals[0]]
-    read = input.pop(0)
+    read = next(input)
 
     while True:
       if read == stack[-1] and read == '$':
         return True
       elif read == stack[-1] and read != '$':
         stack.pop()
-        read = input.pop(0)
+        read = next(input)
       elif stack[-1] in grammar.nterminals and grammar.llTable.get((stack[-1], read), ''):
         aux = grammar.llTable[(stack.pop(), read)][::-1]
         if aux != ['&']:
@@ -325,19 +324,18 @@ class Grammar:
     
     Parameters
     ----------
-    input: str
-      valor da entrada
+    input: str or iterable
+      valor da entrada, separado por espaços, ou sequência de tokens (como a gerada por Lexer.tokens)
     """
 
-    input = input.split()
-    input += ['$']
+    input = chain(input.split() if isinstance(input, str) else input, ['$'])
 
     grammar = self
     if not self.slrTableAction or not self.slrTableGoTo:
       grammar = self.buildSLRTable()
 
     stack = [0]
-    read = input.pop(0)
+    read = next(input)
     while True:
       result = grammar.slrTableAction.get((stack[-1], read), '')
       
@@ -345,7 +343,7 @@ class Grammar:
         return False
       elif result[0] == 'S':
         stack.append(result[1])
-        read = input.pop(0)
+        read = next(input)
       elif result[0] == 'R':
         [stack.pop() for _ in range(len(result[1][1]))]
         stack.append(grammar.slrTableGoTo[(stack[-1], result[1][0])])
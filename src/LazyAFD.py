@@ -0,0 +1,154 @@
+from AF import AF
+
+class LazyAFD:
+  """
+  Uma classe usada para reconhecer cadeias por meio de um autômato finito determinístico construído sob demanda
+
+  Os estados determinísticos são as máscaras de bits da simulação de um AFND e só são criados quando alguma
+  entrada os alcança. Eles ficam armazenados em uma cache de tamanho limitado, que é esvaziada por completo
+  quando atinge o limite. Caso a cache seja esvaziada com frequência excessiva, o reconhecimento passa a usar
+  diretamente a simulação por conjuntos de bits do AFND.
+
+  Attributes
+  ----------
+  af: AFND object
+    autômato simulado
+  limit: int
+    número máximo de estados armazenados na cache
+  cache: dict
+    transições já calculadas, no formato estado -> terminal -> estado
+  hits: int
+    número de transições encontradas na cache
+  misses: int
+    número de transições calculadas
+  flushes: int
+    número de vezes em que a cache foi esvaziada
+  fallback: bool
+    indica se o reconhecimento passou a usar a simulação do AFND
+  version: int
+    versão das máscaras do AFND usadas pela cache, que é esvaziada quando o AFND é recompilado
+  """
+
+  def __init__(self, af, limit=10000):
+    """
+    Parameters
+    ----------
+    af: AFND object
+      autômato simulado
+    limit [default=10000]: int
+      número máximo de estados armazenados na cache
+    """
+
+    if limit < 1:
+      raise Exception('O limite da cache deve ser positivo!')
+
+    self.af = af
+    self.limit = limit
+    self.clear()
+
+  def clear(self):
+    """Esvazia a cache e zera os contadores"""
+
+    self.cache = dict()
+    self.version = None
+    self.hits = 0
+    self.misses = 0
+    self.flushes = 0
+    self.consumed = 0
+    self.fallback = False
+
+  def stats(self):
+    """Retorna os contadores da cache"""
+
+    return {'states': len(self.cache), 'hits': self.hits, 'misses': self.misses, 'flushes': self.flushes, 'fallback': self.fallback}
+
+  def flush(self):
+    """
+    Esvazia a cache, quando cheia, e verifica se houve thrashing
+
+    Assim como no RE2, considera-se thrashing quando foram consumidos menos de 10 símbolos por estado
+    armazenado desde o último esvaziamento.
+    """
+
+    self.fallback = self.consumed < 10 * len(self.cache)
+    self.cache = dict()
+    self.flushes += 1
+    self.consumed = 0
+
+  def startState(self):
+    """Retorna o estado inicial do reconhecimento"""
+
+    cs = self.af.startState()
+    if self.version != self.af.compiled:
+      self.clear()
+      self.version = self.af.compiled
+
+    return cs
+
+  def readChunk(self, cs, chunk):
+    """
+    Consome um bloco da cadeia de entrada, a partir de um estado, e retorna o estado alcançado
+
+    Parameters
+    ----------
+    cs: int
+      máscara do conjunto de estados atual
+    chunk: str
+      bloco da cadeia de entrada
+    """
+
+    if self.fallback:
+      return self.af.readChunk(cs, chunk)
+
+    cache = self.cache
+    for i, t in enumerate(chunk):
+      row = cache.get(cs)
+      if row is None:
+        if len(cache) >= self.limit:
+          self.flush()
+          if self.fallback:
+            return self.af.readChunk(cs, chunk[i:])
+          cache = self.cache
+        row = cache[cs] = dict()
+
+      ns = row.get(t)
+      if ns is None:
+        self.misses += 1
+        ns = row[t] = self.af.step(cs, t)
+      else:
+        self.hits += 1
+
+      cs = ns
+      self.consumed += 1
+      if not cs:
+        break
+
+    return cs
+
+  def isAccepting(self, cs):
+    """
+    Verifica se um estado é de aceitação
+
+    Parameters
+    ----------
+    cs: int
+      máscara do conjunto de estados atual
+    """
+
+    return self.af.isAccepting(cs)
+
+  def isDead(self, cs):
+    """
+    Verifica se um estado é o estado morto
+
+    Parameters
+    ----------
+    cs: int
+      máscara do conjunto de estados atual
+    """
+
+    return self.af.isDead(cs)
+
+  # Mesmo protocolo de reconhecimento dos autômatos compilados
+  matcher = AF.matcher
+  readInput = AF.readInput
@@ -0,0 +1,93 @@
+from MultiER import MultiER
+
+class Lexer:
+  """
+  Uma classe usada para separar uma cadeia de entrada em tokens, a partir de expressões regulares
+
+  As expressões de todas as regras são compiladas em um único AFD, por meio da função FollowPos (MultiER). Cada
+  token é o maior prefixo reconhecido por alguma regra (maximal munch); em caso de empate, vence a regra que
+  aparece primeiro na lista.
+
+  Attributes
+  ----------
+  names: list
+    lista com os nomes dos tokens, na ordem de prioridade
+  ignore: set
+    conjunto de nomes de tokens descartados (comentários, por exemplo)
+  blanks: str
+    caracteres ignorados entre os tokens
+  patterns: MultiER object
+    expressões regulares compiladas
+  winner: list
+    índice da regra vencedora em cada estado do AFD, ou -1 para estados que não são de aceitação
+  """
+
+  def __init__(self, rules, ignore=(), blanks=' \t\r\n'):
+    """
+    Parameters
+    ----------
+    rules: list
+      lista ordenada de pares (nome do token, expressão regular), com expressões como objetos ER ou strings;
+      caracteres reservados, como em operadores (+, *, parênteses), devem ser escapados (veja ER.escape)
+    ignore [default=()]: iterable
+      nomes de tokens descartados
+    blanks [default=' \t\r\n']: str
+      caracteres ignorados entre os tokens; espaços que fazem parte de um token devem ser escapados na expressão regular (veja ER.escape)
+    """
+
+    self.names = [name for name, _ in rules]
+    self.ignore = set(ignore)
+    self.blanks = blanks
+    self.patterns = MultiER([er for _, er in rules])
+
+    af = self.patterns.af
+    self.winner = [min(self.patterns.tags.get(x, [-1])) for x in af.states] + [-1]
+
+  def tokenize(self, input):
+    """
+    Gera, sob demanda, os tokens da cadeia de entrada, como tuplas (nome, lexema, posição)
+
+    Parameters
+    ----------
+    input: str
+      cadeia de caracteres de entrada
+    """
+
+    af = self.patterns.af
+    (table, symbols, dead, width, winner) = (af.table, af.symbols, af.dead, af.width, self.winner)
+
+    pos = 0
+    while pos < len(input):
+      if input[pos] in self.blanks:
+        pos += 1
+        continue
+
+      (cs, end, rule) = (af.start, None, -1)
+      for i in range(pos, len(input)):
+        c = symbols.get(input[i])
+        if c is None:
+          break
+        cs = table[cs + c]
+        if cs == dead:
+          break
+        if winner[cs // width] >= 0:
+          (end, rule) = (i + 1, winner[cs // width])
+
+      if end is None:
+        raise Exception(f'Token inválido na posição {pos}!')
+
+      if self.names[rule] not in self.ignore:
+        yield (self.names[rule], input[pos:end], pos)
+      pos = end
+
+  def tokens(self, input):
+    """
+    Gera, sob demanda, apenas os nomes dos tokens da cadeia de entrada, no formato lido por Grammar
+
+    Parameters
+    ----------
+    input: str
+      cadeia de caracteres de entrada
+    """
+
+    return (name for (name, _, _) in self.tokenize(input))
@@ -0,0 +1,112 @@
+import codecs
+import mmap
+
+class Matcher:
+  """
+  Uma classe usada para reconhecer, de forma incremental, cadeias de entrada em um autômato finito
+
+  Attributes
+  ----------
+  af: AFD or AFND object
+    autômato usado no reconhecimento
+  state: object
+    estado atual do reconhecimento, no formato definido pelo autômato
+  encoding: str
+    codificação usada para decodificar blocos binários
+  """
+
+  def __init__(self, af, encoding='utf-8'):
+    """
+    Parameters
+    ----------
+    af: AFD or AFND object
+      autômato usado no reconhecimento
+    encoding [default='utf-8']: str
+      codificação usada para decodificar blocos binários
+    """
+
+    self.af = af
+    self.encoding = encoding
+    self.reset()
+
+  def reset(self):
+    """Retorna o reconhecimento ao estado inicial do autômato"""
+
+    self.state = self.af.startState()
+    self.decoder = codecs.getincrementaldecoder(self.encoding)()
+
+  def feed(self, chunk):
+    """
+    Consome um bloco da cadeia de entrada
+
+    Parameters
+    ----------
+    chunk: str or bytes
+      bloco da cadeia de entrada
+    """
+
+    if isinstance(chunk, (bytes, bytearray, memoryview)):
+      chunk = self.decoder.decode(chunk)
+
+    if chunk and not self.isDead():
+      self.state = self.af.readChunk(self.state, chunk)
+
+    return self
+
+  def isDead(self):
+    """Verifica se nenhuma continuação da entrada pode ser aceita"""
+
+    return self.af.isDead(self.state)
+
+  def accepts(self):
+    """Verifica se a entrada consumida até o momento é aceita pelo autômato"""
+
+    (pending, _) = self.decoder.getstate()
+    return not pending and self.af.isAccepting(self.state)
+
+  def readFile(self, file, size=1 << 16):
+    """
+    Consome um arquivo aberto, bloco a bloco, e verifica se seu conteúdo é aceito
+
+    Parameters
+    ----------
+    file: file object
+      arquivo aberto em modo texto ou binário
+    size [default=65536]: int
+      tamanho de cada bloco lido
+    """
+
+    end = '' if isinstance(file.read(0), str) else b''
+    for chunk in iter(lambda: file.read(size), end):
+      self.feed(chunk)
+      if self.isDead():
+        break
+
+    return self.accepts()
+
+  def readMmap(self, arquivo, size=1 << 16):
+    """
+    Mapeia um arquivo em memória e verifica se seu conteúdo é aceito
+
+    Parameters
+    ----------
+    arquivo: str
+      caminho do arquivo
+    size [default=65536]: int
+      tamanho de cada bloco consumido
+    """
+
+    with open(arquivo, 'rb') as f:
+      try:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+      except ValueError:
+        # Arquivos vazios não podem ser mapeados em memória
+        return self.accepts()
+
+      with data:
+        for start in range(0, len(data), size):
+          self.feed(data[start:start + size])
+          if self.isDead():
+            break
+
+    return self.accepts()
\ No newline at end of file
@@ -0,0 +1,118 @@
+from AFD import AFD
+from ER import ER
+from Node import Node
+from Tree import Tree
+
+class MultiER:
+  """
+  Uma classe usada para reconhecer, em uma única leitura, várias expressões regulares
+
+  As árvores de derivação das expressões, cada uma com seu próprio marcador de fim (#), são unidas por nodos "+"
+  em uma única árvore, convertida em um único AFD pela função FollowPos. Cada estado de aceitação guarda as
+  expressões cujos marcadores de fim ele contém.
+
+  Attributes
+  ----------
+  patterns: list
+    lista de expressões regulares
+  tree: Tree object
+    árvore de derivação combinada
+  af: AFD object
+    autômato finito determinístico combinado
+  tags: dict
+    dicionário de expressões aceitas, no formato estado -> índices das expressões
+  """
+
+  def __init__(self, patterns):
+    """
+    Parameters
+    ----------
+    patterns: list
+      lista de expressões regulares, como objetos ER ou strings
+    """
+
+    if not patterns:
+      raise Exception('Nenhuma expressão regular informada!')
+
+    # Cada expressão é reconstruída, para que sua árvore possa ser incorporada à árvore combinada
+    self.patterns = [ER(x if isinstance(x, str) else x.expression[:-1]) for x in patterns]
+
+    markers = dict()
+    nodes = []
+    for i, er in enumerate(self.patterns):
+      leaves = [node for node in MultiER.nodes(er.tree.root) if node.isLeaf() and node.data_value == '#']
+      if len(leaves) != 1:
+        raise Exception('Expressão inválida!')
+      markers[leaves[0]] = i
+      nodes.append(er.tree.root)
+
+    # As árvores são unidas aos pares, mantendo a árvore combinada balanceada
+    while len(nodes) > 1:
+      aux = []
+      for j in range(0, len(nodes) - 1, 2):
+        node = Node('+', l_child=nodes[j], r_child=nodes[j + 1])
+        nodes[j].parent = nodes[j + 1].parent = node
+        aux.append(node)
+      nodes = aux + nodes[len(nodes) - len(nodes) % 2:]
+
+    self.tree = Tree()
+    self.tree.root = self.tree.last = nodes[0]
+
+    (af, states) = ER.treeToAF(self.tree)
+    positions = dict((node.index, i) for node, i in markers.items())
+
+    self.af = AFD(af)
+    self.af.compile()
+    self.tags = dict()
+    for state, x in states.items():
+      aux = tuple(sorted(positions[y] for y in x if y in positions))
+      if aux:
+        self.tags[state] = aux
+
+  @staticmethod
+  def nodes(root):
+    """
+    Retorna, sem recursão, todos os nodos de uma subárvore
+
+    Parameters
+    ----------
+    root: Node object
+      nó raiz da subárvore
+    """
+
+    aux = []
+    stack = [root]
+    while stack:
+      node = stack.pop()
+      aux.append(node)
+      stack += [x for x in (node.l_child, node.m_child, node.r_child) if x]
+
+    return aux
+
+  def match(self, input):
+    """
+    Retorna os índices das expressões regulares que reconhecem a cadeia de entrada
+
+    Parameters
+    ----------
+    input: str
+      cadeia de caracteres de entrada
+    """
+
+    cs = self.af.readChunk(self.af.startState(), input)
+    if self.af.isDead(cs):
+      return []
+
+    return list(self.tags.get(self.af.states[cs // self.af.width], ()))
+
+  def matchMany(self, inputs):
+    """
+    Retorna, para cada cadeia de entrada, os índices das expressões regulares que a reconhecem
+
+    Parameters
+    ----------
+    inputs: iterable
+      cadeias de caracteres de entrada
+    """
+
+    return [self.match(input) for input in inputs]
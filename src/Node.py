@@ -16,8 +16,16 @@ class Node:
     nodo pai do nodo atual
   index: int
     índice do nodo folha
+  nullable: bool
+    indica se o nodo é anulável, calculado por Tree.followPos
+  first_pos: int
+    conjunto FirstPos do nodo, como máscara de bits dos índices das folhas
+  last_pos: int
+    conjunto LastPos do nodo, como máscara de bits dos índices das folhas
   """
 
+  __slots__ = ('data_value', 'l_child', 'r_child', 'm_child', 'parent', 'index', 'nullable', 'first_pos', 'last_pos')
+
   def __init__(self, data_value, l_child=None, r_child=None, m_child=None, parent=None, index=0):
     """
     Parameters
@@ -42,6 +50,9 @@ class Node:
     self.m_child = m_child
     self.parent = parent
     self.index = index
+    self.nullable = False
+    self.first_pos = 0
+    self.last_pos = 0
 
   def isLeaf(self):
     """Verifica se o nodo é uma folha"""
@@ -54,44 +65,43 @@ class Node:
     return self.data_value in ['*', '+', '.']
 
   def isNullable(self):
-    """Verifica se o nodo é anulável"""
+    """Verifica se o nodo é anulável, a partir dos atributos calculados por Tree.followPos"""
 
-    if self.data_value in ['*', '&']:
-      return True
-    elif self.l_child and self.r_child:
-      if self.data_value == '+':
-        return self.l_child.isNullable() or self.r_child.isNullable()
-      elif self.data_value == '.':
-        return self.l_child.isNullable() and self.r_child.isNullable()
-    return False
+    return self.nullable
   
   def firstPos(self):
-    """Retorna o conjunto FirstPos do nodo"""
+    """Retorna o conjunto FirstPos do nodo, como máscara de bits, a partir dos atributos calculados por Tree.followPos"""
 
-    if self.data_value == '&':
-      return []
-    elif self.data_value == '*':
-      return self.m_child.firstPos()
-    elif self.l_child and self.r_child:
-      if self.data_value == '+':
-        return self.l_child.firstPos() + self.r_child.firstPos()
-      elif self.data_value == '.':
-        return self.l_child.firstPos() + self.r_child.firstPos() if self.l_child.isNullable() else self.l_child.firstPos()
-    return [self]
+    return self.first_pos
 
   def lastPos(self):
-    """Retorna o conjunto LastPos do nodo"""
+    """Retorna o conjunto LastPos do nodo, como máscara de bits, a partir dos atributos calculados por Tree.followPos"""
+
+    return self.last_pos
+
+  def annotate(self):
+    """
+    Calcula os atributos nullable, first_pos e last_pos do nodo, a partir dos atributos de seus filhos
+
+    Os filhos devem ter sido anotados antes do nodo, e as folhas devem estar numeradas.
+    """
 
-    if self.data_value == '&':
-      return []
-    elif self.data_value == '*':
-      return self.m_child.lastPos()
-    elif self.l_child and self.r_child:
+    if self.data_value == '&' and self.isLeaf():
+      (self.nullable, self.first_pos, self.last_pos) = (True, 0, 0)
+    elif self.data_value == '*' and self.m_child:
+      (self.nullable, self.first_pos, self.last_pos) = (True, self.m_child.first_pos, self.m_child.last_pos)
+    elif self.l_child and self.r_child and self.data_value in ['+', '.']:
+      (l, r) = (self.l_child, self.r_child)
       if self.data_value == '+':
-        return self.l_child.lastPos() + self.r_child.lastPos()
-      elif self.data_value == '.':
-        return self.l_child.lastPos() + self.r_child.lastPos() if self.r_child.isNullable() else self.r_child.lastPos()
-    return [self]
+        self.nullable = l.nullable or r.nullable
+        self.first_pos = l.first_pos | r.first_pos
+        self.last_pos = l.last_pos | r.last_pos
+      else:
+        self.nullable = l.nullable and r.nullable
+        self.first_pos = l.first_pos | r.first_pos if l.nullable else l.first_pos
+        self.last_pos = l.last_pos | r.last_pos if r.nullable else r.last_pos
+    else:
+      (self.nullable, self.first_pos, self.last_pos) = (False, 1 << self.index, 1 << self.index)
 
   def print(self):
     """Imprime, na tela, o nodo e seus filhos"""
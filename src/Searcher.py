@@ -0,0 +1,183 @@
+import re
+from AF import AF
+from AFD import AFD
+
+class Searcher:
+  """
+  Uma classe usada para encontrar, em um texto, as ocorrências da linguagem de um autômato finito
+
+  As ocorrências seguem a semântica leftmost-longest e não se sobrepõem. Uma única leitura reversa do texto, com
+  um AFD para Σ*·reverso(L), marca todas as posições em que alguma ocorrência começa; a partir de cada início
+  marcado (e apenas deles), um AFD ancorado para L encontra o fim mais longo. O texto pode ser uma str, bytes,
+  bytearray, memoryview ou mmap; em entradas binárias, cada byte é lido como o caractere de mesmo código (latin-1).
+
+  Attributes
+  ----------
+  forward: AFD object
+    autômato determinístico mínimo, compilado, da linguagem procurada
+  backward: AFD object
+    autômato determinístico, compilado, de Σ*·reverso(L)
+  """
+
+  NONZERO = re.compile(b'[^\x00]')
+
+  def __init__(self, af):
+    """
+    Parameters
+    ----------
+    af: AF object
+      instância de um autômato finito
+    """
+
+    # Sem estados mortos explícitos, a busca do fim mais longo para assim que nenhuma ocorrência pode ser estendida
+    self.forward = AFD(AF.minimize(af)).compile()
+    self.backward = AFD(AF.deterministic(Searcher.backwardAF(af))).compile()
+
+  @staticmethod
+  def backwardAF(af):
+    """
+    Retorna um autômato para Σ*·reverso(L), onde L é a linguagem do autômato informado
+
+    Parameters
+    ----------
+    af: AF object
+      instância de um autômato finito
+    """
+
+    terminals = [t for t in af.terminals if t != '&']
+    (loop, hub) = (max(af.vertices) + 1, max(af.vertices) + 2)
+
+    new_transitions = dict()
+    for ((fonte, destino), value) in af.transitions.items():
+      new_transitions.setdefault((destino, fonte), []).extend(value)
+    if terminals:
+      new_transitions[loop, loop] = terminals
+    new_transitions[loop, hub] = ['&']
+    for x in set(af.final):
+      new_transitions.setdefault((hub, x), []).append('&')
+
+    return AF(list(af.vertices) + [loop, hub], new_transitions, loop, [af.initial])
+
+  @staticmethod
+  def lookup(af, text):
+    """
+    Retorna uma função que converte um elemento do texto no código de terminal do AFD compilado, ou None
+
+    Parameters
+    ----------
+    af: AFD object
+      autômato determinístico compilado
+    text: str or bytes
+      texto de entrada
+    """
+
+    if isinstance(text, str):
+      return af.symbols.get
+
+    return [af.symbols.get(chr(b)) for b in range(256)].__getitem__
+
+  def starts(self, text):
+    """
+    Marca, em uma única leitura reversa do texto, as posições onde começa alguma ocorrência
+
+    Retorna um vetor de bits, onde o bit i indica se alguma ocorrência começa na posição i.
+
+    Parameters
+    ----------
+    text: str or bytes
+      texto de entrada
+    """
+
+    af = self.backward
+    (table, dead, width, accepting) = (af.table, af.dead, af.width, af.accepting)
+    code = Searcher.lookup(af, text)
+
+    marks = bytearray((len(text) >> 3) + 1)
+    cs = af.start
+    if accepting[cs // width]:
+      marks[len(text) >> 3] |= 1 << (len(text) & 7)
+
+    for i in range(len(text) - 1, -1, -1):
+      c = code(text[i])
+      # Caracteres fora do alfabeto só podem ser consumidos pelo laço de Σ*, que leva de volta ao estado inicial
+      cs = af.start if c is None or cs == dead else table[cs + c]
+      if cs != dead and accepting[cs // width]:
+        marks[i >> 3] |= 1 << (i & 7)
+
+    return marks
+
+  def longest(self, text, start, code):
+    """
+    Retorna o fim da ocorrência mais longa que começa em determinada posição, ou None
+
+    Parameters
+    ----------
+    text: str or bytes
+      texto de entrada
+    start: int
+      posição inicial da ocorrência
+    code: function
+      função de conversão dos elementos do texto em códigos de terminais
+    """
+
+    af = self.forward
+    (table, dead, width, accepting) = (af.table, af.dead, af.width, af.accepting)
+
+    cs = af.start
+    end = start if accepting[cs // width] else None
+    for j in range(start, len(text)):
+      c = code(text[j])
+      if c is None:
+        break
+      cs = table[cs + c]
+      if cs == dead:
+        break
+      if accepting[cs // width]:
+        end = j + 1
+
+    return end
+
+  def finditer(self, text, pos=0):
+    """
+    Gera, da esquerda para a direita, as ocorrências não sobrepostas da linguagem no texto, como pares (início, fim)
+
+    Parameters
+    ----------
+    text: str or bytes
+      texto de entrada
+    pos [default=0]: int
+      posição a partir da qual a busca é feita
+    """
+
+    marks = self.starts(text)
+    code = Searcher.lookup(self.forward, text)
+
+    while pos <= len(text):
+      aux = marks[pos >> 3] >> (pos & 7)
+      if not aux:
+        # Salta, em C, os bytes sem inícios marcados
+        match = Searcher.NONZERO.search(marks, (pos >> 3) + 1)
+        if not match:
+          return
+        pos = match.start() << 3
+        continue
+
+      pos += (aux & -aux).bit_length() - 1
+      end = self.longest(text, pos, code)
+      yield (pos, end)
+
+      pos = max(end, pos + 1)
+
+  def search(self, text, pos=0):
+    """
+    Retorna a primeira ocorrência da linguagem no texto, como um par (início, fim), ou None
+
+    Parameters
+    ----------
+    text: str or bytes
+      texto de entrada
+    pos [default=0]: int
+      posição a partir da qual a busca é feita
+    """
+
+    return next(self.finditer(text, pos), None)
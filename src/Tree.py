@@ -25,29 +25,21 @@ class Tree:
     self.root.print()
 
   def followPos(self):
-    """Calcula a função FollowPos da árvore"""
-
-    def iterate(node):
-      """
-      Retorna uma lista com os nós pertencentes à uma subárvore
-      
-      Parameters
-      ----------
-      node: Node object
-        nó raiz da subárvore
-      """
-
-      aux = [node]
-      if node.l_child:
-        aux += iterate(node.l_child)
-      if node.m_child:
-        aux += iterate(node.m_child)
-      if node.r_child:
-        aux += iterate(node.r_child)
-      return aux
-
-    nodes = iterate(self.root)
-    
+    """
+    Calcula a função FollowPos da árvore
+
+    As folhas são numeradas em pré-ordem e, em uma única passagem iterativa dos filhos para os pais, cada nodo
+    recebe seus atributos nullable, first_pos e last_pos. Retorna um dicionário com o conjunto FollowPos de cada
+    folha, como máscara de bits dos índices.
+    """
+
+    nodes = []
+    stack = [self.root]
+    while stack:
+      node = stack.pop()
+      nodes.append(node)
+      stack += [x for x in (node.r_child, node.m_child, node.l_child) if x]
+
     count = 1
     for node in nodes:
       if node.isLeaf():
@@ -55,19 +47,40 @@ class Tree:
         self.dict[count] = node.data_value
         count += 1
 
-    follow_pos = dict()
-    for node in nodes:
-      if node.data_value == '*':
-        for lp in node.lastPos():
-          follow_pos[lp.index] = follow_pos.get(lp.index, []) + [fp.index for fp in node.firstPos()]
-      elif node.data_value == '.':
-        for lp in node.l_child.lastPos():
-          follow_pos[lp.index] = follow_pos.get(lp.index, []) + [fp.index for fp in node.r_child.firstPos()]
-      elif node.isLeaf():
-        follow_pos[node.index] = follow_pos.get(node.index, []) + []
+    follow_pos = dict.fromkeys(range(1, count), 0)
+    for node in reversed(nodes):
+      node.annotate()
+      if node.data_value == '*' and node.m_child:
+        (aux, first) = (node.last_pos, node.first_pos)
+      elif node.data_value == '.' and node.l_child and node.r_child:
+        (aux, first) = (node.l_child.last_pos, node.r_child.first_pos)
+      else:
+        continue
+
+      for lp in Tree.indices(aux):
+        follow_pos[lp] |= first
     
     return follow_pos
 
+  @staticmethod
+  def indices(mask):
+    """
+    Retorna a lista ordenada dos índices presentes em uma máscara de bits
+
+    Parameters
+    ----------
+    mask: int
+      máscara de bits
+    """
+
+    aux = []
+    while mask:
+      low = mask & -mask
+      aux.append(low.bit_length() - 1)
+      mask ^= low
+
+    return aux
+
   def insert(self, data):
     """
     Insere, na árvore, um novo nodo